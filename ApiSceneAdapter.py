@@ -0,0 +1,261 @@
+from collections import namedtuple
+
+import maya.api.OpenMaya as om
+import maya.cmds as cmds
+
+from . import ModifierUndo
+from .SceneAdapter import SceneAdapter
+from .Instrumentation import instrumentation
+
+_STANDIN_TYPE = "aiStandIn"
+_INCLUDE_GRAPH_TYPE = "aiIncludeGraph"
+
+# What is read of a standin in one pass : the plugged include graphs are by normalized filename
+StandinRecord = namedtuple("StandinRecord", ["object_name", "dso", "operators", "plugged"])
+
+
+def build_operator_modifier(operator_changes, get_mobject):
+    """
+    Build the MDGModifier of operator changes
+    :param operator_changes: OperatorChanges
+    :param get_mobject: function giving the MObject of a standin or an include graph
+    :return: modifier, MObjects of the include graphs created
+    """
+    modifier = om.MDGModifier()
+    mobjects = {}
+
+    def get_cached_mobject(node):
+        if node not in mobjects:
+            mobjects[node] = get_mobject(node)
+        return mobjects[node]
+
+    def get_operator_plug(standin, index):
+        operators_plug = om.MFnDependencyNode(get_cached_mobject(standin)).findPlug("operators", False)
+        return operators_plug.elementByLogicalIndex(index)
+
+    for standin, index in operator_changes.get_disconnections():
+        operator_plug = get_operator_plug(standin, index)
+        source_plug = operator_plug.source()
+        if not source_plug.isNull:
+            modifier.disconnect(source_plug, operator_plug)
+    for include_graph, filename in operator_changes.get_filenames().items():
+        modifier.newPlugValueString(
+            om.MFnDependencyNode(get_cached_mobject(include_graph)).findPlug("filename", False), filename)
+    for include_graph, name in operator_changes.get_names().items():
+        modifier.renameNode(get_cached_mobject(include_graph), name)
+    created = []
+    for standin, index, name, filename in operator_changes.get_creations():
+        mobject = modifier.createNode(_INCLUDE_GRAPH_TYPE)
+        modifier.renameNode(mobject, name)
+        include_graph_fn = om.MFnDependencyNode(mobject)
+        modifier.newPlugValueString(include_graph_fn.findPlug("filename", False), filename)
+        modifier.connect(include_graph_fn.findPlug("out", False), get_operator_plug(standin, index))
+        created.append(mobject)
+    return modifier, created
+
+
+class ApiSceneAdapter(SceneAdapter):
+    """
+    Scene of the current Maya session read with the Maya Python API 2.0 : standins are the full DAG paths of
+    their shape and include graphs their name. The standins of the scene are read in one pass and kept until
+    the next refresh, no PyNode is built
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__records = {}
+        self.__complete = False
+
+    @staticmethod
+    def __normalize_filename(filename):
+        """
+        Normalize the filename of an include graph
+        :param filename
+        :return: normalized filename
+        """
+        return filename.replace("\\", "/") if filename is not None else ""
+
+    @staticmethod
+    def __get_mobject(name):
+        """
+        Getter of the MObject of a node
+        :param name: name or DAG path
+        :return: MObject
+        """
+        selection = om.MSelectionList()
+        selection.add(name)
+        return selection.getDependNode(0)
+
+    @staticmethod
+    def __read_standin(mobject):
+        """
+        Read a standin with direct plug reads
+        :param mobject: MObject of the aiStandIn shape
+        :return: standin record
+        """
+        standin_fn = om.MFnDagNode(mobject)
+        object_name = om.MDagPath.getAPathTo(standin_fn.parent(0)).partialPathName()
+        dso = standin_fn.findPlug("dso", False).asString()
+        operators = {}
+        plugged = {}
+        operators_plug = standin_fn.findPlug("operators", False)
+        for index in operators_plug.getExistingArrayAttributeIndices():
+            source_plug = operators_plug.elementByLogicalIndex(index).source()
+            if source_plug.isNull:
+                continue
+            source_fn = om.MFnDependencyNode(source_plug.node())
+            operators[index] = source_fn.name()
+            if source_fn.typeName == _INCLUDE_GRAPH_TYPE:
+                filename = source_fn.findPlug("filename", False).asString()
+                plugged[ApiSceneAdapter.__normalize_filename(filename)] = source_fn.name()
+        return StandinRecord(object_name, dso, operators, plugged)
+
+    def __get_record(self, standin, fresh=False):
+        """
+        Getter of the record of a standin, read if not known yet
+        :param standin
+        :param fresh: whether the standin is read again
+        :return: standin record
+        """
+        record = self.__records.get(standin) if not fresh else None
+        if record is None:
+            record = ApiSceneAdapter.__read_standin(ApiSceneAdapter.__get_mobject(standin))
+            self.__records[standin] = record
+        return record
+
+    def refresh(self):
+        self.__records.clear()
+        self.__complete = False
+
+    @instrumentation.counted("dg.list_standins")
+    def list_standins(self):
+        # One pass on the plugin shapes of the scene
+        standins = []
+        records = {}
+        it = om.MItDependencyNodes(om.MFn.kPluginShape)
+        while not it.isDone():
+            mobject = it.thisNode()
+            standin_fn = om.MFnDagNode(mobject)
+            if standin_fn.typeName == _STANDIN_TYPE:
+                standin = standin_fn.fullPathName()
+                records[standin] = ApiSceneAdapter.__read_standin(mobject)
+                if not standin_fn.name().startswith("frame"):
+                    standins.append(standin)
+            it.next()
+        self.__records = records
+        self.__complete = True
+        return standins
+
+    @instrumentation.counted("dg.list_selected_standins")
+    def list_selected_standins(self):
+        """
+        List the standins within the selection : the standins selected, the standins of the proxies selected and
+        the standins under the selected nodes. The whole selection is walked at once and each standin is listed once
+        :return: standins or None if nothing is selected
+        """
+        selection = cmds.ls(selection=True, long=True)
+        if not selection:
+            return None
+        shapes = cmds.ls(selection, type=_STANDIN_TYPE, long=True) or []
+        transforms = cmds.ls(selection, type="transform", long=True) or []
+        if len(transforms) > 0:
+            # Proxies : transforms under the transform of a standin
+            parents = cmds.listRelatives(transforms, parent=True, fullPath=True) or []
+            if len(parents) > 0:
+                shapes.extend(cmds.listRelatives(parents, shapes=True, noIntermediate=True, type=_STANDIN_TYPE,
+                                                 fullPath=True) or [])
+        # The nodes under another selected node are already walked with it
+        selected = set(selection)
+        roots = [path for path in selection if path.startswith("|") and
+                 not any(path[:i] in selected for i in range(1, len(path)) if path[i] == "|")]
+        if len(roots) > 0:
+            shapes.extend(cmds.listRelatives(roots, allDescendents=True, type=_STANDIN_TYPE, fullPath=True) or [])
+        return ApiSceneAdapter.__get_unique_standins(shapes)
+
+    @staticmethod
+    def __get_unique_standins(shapes):
+        """
+        Remove the duplicates of standin shapes, the instances of a shape are the same standin
+        :param shapes: DAG paths
+        :return: standins
+        """
+        standins = []
+        known = set()
+        for shape in dict.fromkeys(shapes):
+            standin = om.MDagPath.getAPathTo(ApiSceneAdapter.__get_mobject(shape)).fullPathName()
+            if standin not in known:
+                known.add(standin)
+                standins.append(standin)
+        return standins
+
+    @instrumentation.counted("dg.get_object_name")
+    def get_object_name(self, standin):
+        return self.__get_record(standin).object_name
+
+    @instrumentation.counted("dg.get_dso")
+    def get_dso(self, standin):
+        return self.__get_record(standin).dso
+
+    @instrumentation.counted("dg.set_dso")
+    def set_dso(self, standin, dso):
+        cmds.setAttr(standin + ".dso", dso, type="string")
+        record = self.__records.get(standin)
+        if record is not None:
+            self.__records[standin] = record._replace(dso=dso)
+
+    @instrumentation.counted("dg.get_plugged_include_graphs")
+    def get_plugged_include_graphs(self, standins=None):
+        if standins is not None:
+            # Queried after the operators have been changed
+            return {standin: self.__get_record(standin, fresh=True).plugged for standin in standins}
+        if not self.__complete:
+            self.list_standins()
+        return {standin: record.plugged for standin, record in self.__records.items()}
+
+    @instrumentation.counted("dg.get_operators")
+    def get_operators(self, standin):
+        # Always read again as the slots are allocated on it
+        return dict(self.__get_record(standin, fresh=True).operators)
+
+    @instrumentation.counted("dg.create_include_graph")
+    def create_include_graph(self, name, filename):
+        include_graph = cmds.createNode(_INCLUDE_GRAPH_TYPE, name=name)
+        cmds.setAttr(include_graph + ".filename", filename, type="string")
+        return include_graph
+
+    @instrumentation.counted("dg.set_include_graph_filename")
+    def set_include_graph_filename(self, include_graph, filename):
+        cmds.setAttr(include_graph + ".filename", filename, type="string")
+
+    @instrumentation.counted("dg.rename_include_graph")
+    def rename_include_graph(self, include_graph, name):
+        cmds.rename(include_graph, name)
+
+    @instrumentation.counted("dg.connect_operator")
+    def connect_operator(self, include_graph, standin, index):
+        cmds.connectAttr(include_graph + ".out", "%s.operators[%d]" % (standin, index), force=True)
+        self.__records.pop(standin, None)
+
+    @instrumentation.counted("dg.disconnect_operator")
+    def disconnect_operator(self, standin, index):
+        operator_plug = "%s.operators[%d]" % (standin, index)
+        for source_plug in cmds.listConnections(operator_plug, source=True, destination=False, plugs=True) or []:
+            cmds.disconnectAttr(source_plug, operator_plug)
+        self.__records.pop(standin, None)
+
+    @instrumentation.counted("dg.apply_operator_changes")
+    def apply_operator_changes(self, operator_changes):
+        # All the changes in one MDGModifier executed as one undo step
+        if len(operator_changes) == 0:
+            return []
+        modifier, created = build_operator_modifier(operator_changes, ApiSceneAdapter.__get_mobject)
+        ModifierUndo.commit(modifier)
+        # The include graphs renamed or retargeted may be plugged on any standin read
+        self.refresh()
+        return [om.MFnDependencyNode(mobject).name() for mobject in created]
+
+    @instrumentation.counted("dg.clear_selection")
+    def clear_selection(self):
+        cmds.select(clear=True)
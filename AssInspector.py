@@ -0,0 +1,200 @@
+import mmap
+import os
+import re
+import threading
+from collections import OrderedDict
+
+from .Instrumentation import instrumentation, logger
+
+# Start of a node : its type alone on a line followed by a line starting with "{"
+_NODE_PATTERN = re.compile(rb"^([A-Za-z_]\w*)[ \t]*\r?\n\{", re.MULTILINE)
+_NODE_END_PATTERN = re.compile(rb"^\}", re.MULTILINE)
+_NAME_PATTERN = re.compile(rb"^[ \t]*name[ \t]+(\"[^\"\r\n]*\"|\S+)", re.MULTILINE)
+_SELECTION_PATTERN = re.compile(rb"^[ \t]*selection[ \t]+\"((?:[^\"\\\r\n]|\\.)*)\"", re.MULTILINE)
+# Shader assigned by an operator : shader = "name" in an assignment string, the quotes may be escaped
+_SHADER_ASSIGNMENT_PATTERN = re.compile(rb"\bshader[ \t]*=[ \t]*(?:\\?[\"'])?([^\"'\\\s]+)")
+# Files referenced by a parameter of a node or assigned by an operator
+_FILE_PARAMETER_PATTERN = re.compile(rb"^[ \t]*(?:filename|texturename)[ \t]+\"([^\"\r\n]+)\"", re.MULTILINE)
+_FILE_ASSIGNMENT_PATTERN = re.compile(rb"\b(?:filename|texturename)[ \t]*=[ \t]*\\?[\"']([^\"'\\\r\n]+)")
+
+_OPERATOR_TYPES = (b"set_parameter", b"materialx")
+
+
+class AssSummary:
+    """
+    What a look .ass file does : the number of nodes by type, the selection expressions of its operators,
+    the shaders they assign and the files referenced
+    """
+    __slots__ = ("__node_counts", "__selections", "__shaders", "__file_references")
+
+    def __init__(self, node_counts, selections, shaders, file_references=()):
+        """
+        Constructor
+        :param node_counts: {node type: count}
+        :param selections: [(operator type, operator name, selection expression)]
+        :param shaders: shader names
+        :param file_references: textures and files referenced, as written in the file
+        """
+        self.__node_counts = node_counts
+        self.__selections = tuple(selections)
+        self.__shaders = tuple(shaders)
+        self.__file_references = tuple(file_references)
+
+    def get_node_counts(self):
+        """
+        Getter of the number of nodes by type
+        :return: {node type: count}
+        """
+        return dict(self.__node_counts)
+
+    def get_selections(self):
+        """
+        Getter of the selection expressions of the set_parameter and materialx operators
+        :return: [(operator type, operator name, selection expression)]
+        """
+        return self.__selections
+
+    def get_shaders(self):
+        """
+        Getter of the shaders assigned by the operators
+        :return: shader names
+        """
+        return self.__shaders
+
+    def get_file_references(self):
+        """
+        Getter of the textures and files referenced
+        :return: paths as written in the file
+        """
+        return self.__file_references
+
+    def format(self, max_lines=10):
+        """
+        Format the summary as a text
+        :param max_lines: maximum number of selections and shaders listed
+        :return: text
+        """
+        lines = ["Nodes : " + ", ".join("%s %d" % (node_type, count) for node_type, count in
+                                        sorted(self.__node_counts.items(), key=lambda item: (-item[1], item[0])))]
+        if len(self.__selections) > 0:
+            lines.append("Selections :")
+            lines.extend("  %s %s : %s" % selection for selection in self.__selections[:max_lines])
+            if len(self.__selections) > max_lines:
+                lines.append("  ... %d more" % (len(self.__selections) - max_lines))
+        if len(self.__shaders) > 0:
+            lines.append("Shaders :")
+            lines.extend("  " + shader for shader in self.__shaders[:max_lines])
+            if len(self.__shaders) > max_lines:
+                lines.append("  ... %d more" % (len(self.__shaders) - max_lines))
+        if len(self.__file_references) > 0:
+            lines.append("Files referenced : %d" % len(self.__file_references))
+        return "\n".join(lines)
+
+
+class AssInspector:
+    """
+    Summarize look .ass files without loading them : the files are memory-mapped and only the node headers and the
+    parameters of the operators are decoded. The summaries are kept by path and modification time
+    """
+
+    def __init__(self, max_size=1024):
+        """
+        Constructor
+        :param max_size: maximum number of summaries kept in the cache
+        """
+        self.__max_size = max_size
+        self.__summaries = OrderedDict()
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def __decode(value):
+        """
+        Decode a value read in a .ass file
+        :param value: bytes
+        :return: string without quotes
+        """
+        return value.decode("utf-8", errors="replace").strip("\"")
+
+    @staticmethod
+    def __scan(buffer):
+        """
+        Scan the nodes of a .ass file
+        :param buffer: mmap of the file
+        :return: AssSummary
+        """
+        node_counts = {}
+        selections = []
+        shaders = {}
+        pos = 0
+        while True:
+            node_match = _NODE_PATTERN.search(buffer, pos)
+            if node_match is None:
+                break
+            end_match = _NODE_END_PATTERN.search(buffer, node_match.end())
+            end = end_match.start() if end_match is not None else len(buffer)
+            node_type = node_match.group(1)
+            node_type_name = AssInspector.__decode(node_type)
+            node_counts[node_type_name] = node_counts.get(node_type_name, 0) + 1
+            if node_type in _OPERATOR_TYPES:
+                name_match = _NAME_PATTERN.search(buffer, node_match.end(), end)
+                name = AssInspector.__decode(name_match.group(1)) if name_match is not None else ""
+                selection_match = _SELECTION_PATTERN.search(buffer, node_match.end(), end)
+                if selection_match is not None:
+                    selections.append((node_type_name, name, AssInspector.__decode(selection_match.group(1))))
+                for shader_match in _SHADER_ASSIGNMENT_PATTERN.finditer(buffer, node_match.end(), end):
+                    shaders[AssInspector.__decode(shader_match.group(1))] = None
+            pos = end_match.end() if end_match is not None else end
+        file_references = {}
+        for pattern in (_FILE_PARAMETER_PATTERN, _FILE_ASSIGNMENT_PATTERN):
+            for file_match in pattern.finditer(buffer):
+                file_references[AssInspector.__decode(file_match.group(1))] = None
+        return AssSummary(node_counts, selections, shaders, file_references)
+
+    def get_cached(self, path):
+        """
+        Getter of the last summary of a .ass file without accessing the filesystem
+        :param path
+        :return: AssSummary or None if the file has not been inspected yet
+        """
+        with self.__lock:
+            entry = self.__summaries.get(path)
+            return entry[1] if entry is not None else None
+
+    @instrumentation.counted("ass.inspect")
+    def inspect(self, path):
+        """
+        Summary of a .ass file, scanned again only if it has been modified
+        :param path
+        :return: AssSummary or None if the file can't be read
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self.__lock:
+            entry = self.__summaries.get(path)
+            if entry is not None and entry[0] == signature:
+                self.__summaries.move_to_end(path)
+                instrumentation.count("ass.hit")
+                return entry[1]
+        if stat.st_size == 0:
+            summary = AssSummary({}, [], [])
+        else:
+            try:
+                with instrumentation.span("AssInspector.scan"), open(path, "rb") as ass_file, \
+                        mmap.mmap(ass_file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    summary = AssInspector.__scan(buffer)
+            except (OSError, ValueError) as e:
+                logger.warning("Look %s could not be inspected : %s", path, e)
+                return None
+        with self.__lock:
+            self.__summaries[path] = (signature, summary)
+            self.__summaries.move_to_end(path)
+            while len(self.__summaries) > self.__max_size:
+                self.__summaries.popitem(last=False)
+        return summary
+
+
+# Inspector shared by the tool
+ass_inspector = AssInspector()
@@ -0,0 +1,188 @@
+import os
+import threading
+from collections import OrderedDict
+
+from .Instrumentation import instrumentation
+
+
+class DirectoryEntry:
+    __slots__ = ("name", "path", "is_file", "is_dir")
+
+    def __init__(self, name, path, is_file, is_dir):
+        """
+        Constructor
+        :param name
+        :param path
+        :param is_file
+        :param is_dir
+        """
+        self.name = name
+        self.path = path
+        self.is_file = is_file
+        self.is_dir = is_dir
+
+
+class DirectoryCache:
+    def __init__(self, max_size=4096):
+        """
+        Constructor
+        :param max_size: maximum number of directories kept in the cache
+        """
+        self.__max_size = max_size
+        self.__entries = OrderedDict()
+        self.__generation = 0
+        # Listings listed since the last save : {directory: (mtime, [(name, is_file, is_dir)])}
+        self.__changed = {}
+        # Listings loaded from a previous session, kept up to date when listed again but never extended :
+        # {directory: (mtime, [(name, is_file, is_dir)])}
+        self.__known = {}
+        self.__lock = threading.RLock()
+
+    @staticmethod
+    def __normalize(path):
+        """
+        Normalize a path to be used as a key
+        :param path
+        :return: normalized path
+        """
+        return os.path.normpath(path).replace("\\", "/")
+
+    @staticmethod
+    def __get_mtime(path):
+        """
+        Get the modification time of a directory
+        :param path
+        :return: mtime or None if the directory doesn't exist
+        """
+        instrumentation.count("fs.stat")
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def __list(path):
+        """
+        List a directory in one pass
+        :param path
+        :return: tuple of DirectoryEntry
+        """
+        instrumentation.count("fs.scandir")
+        entries = []
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    is_file = entry.is_file()
+                    is_dir = entry.is_dir()
+                except OSError:
+                    continue
+                entries.append(DirectoryEntry(entry.name, entry.path.replace("\\", "/"), is_file, is_dir))
+        return tuple(sorted(entries, key=lambda e: e.name))
+
+    def load(self, listings):
+        """
+        Load listings known from a previous session. They are kept apart from the cache, whatever their number,
+        and only consulted when a directory is not in the cache. They are revalidated against the mtime of the directory
+        on first access
+        :param listings: {directory: (mtime, [(name, is_file, is_dir)])}
+        :return:
+        """
+        with self.__lock:
+            for directory, listing in listings.items():
+                self.__known[DirectoryCache.__normalize(directory)] = listing
+
+    def __get_known(self, key):
+        """
+        Getter of the listing of a directory known from a previous session (under the lock)
+        :param key: normalized directory
+        :return: (generation, mtime, entries) or None
+        """
+        listing = self.__known.get(key)
+        if listing is None:
+            return None
+        mtime, entries = listing
+        entries = tuple(sorted((DirectoryEntry(name, key + "/" + name, is_file, is_dir)
+                                for name, is_file, is_dir in entries), key=lambda e: e.name))
+        # Generation -1 so that the mtime is checked
+        return -1, mtime, entries
+
+    def pop_changed(self):
+        """
+        Get the listings that have been listed again since the last call
+        :return: {directory: (mtime, [(name, is_file, is_dir)])}
+        """
+        with self.__lock:
+            changed = self.__changed
+            self.__changed = {}
+            return changed
+
+    def refresh(self):
+        """
+        Start a new refresh : every directory will be checked against its mtime again on next access
+        :return:
+        """
+        with self.__lock:
+            self.__generation += 1
+
+    def invalidate(self, path=None):
+        """
+        Invalidate a directory or the whole cache
+        :param path: directory to invalidate, None to invalidate everything
+        :return:
+        """
+        with self.__lock:
+            if path is None:
+                self.__entries.clear()
+                self.__known.clear()
+            else:
+                key = DirectoryCache.__normalize(path)
+                self.__entries.pop(key, None)
+                self.__known.pop(key, None)
+
+    def listdir(self, path):
+        """
+        Get the entries of a directory. The directory is listed at most once per refresh and
+        listed again only if its mtime has changed
+        :param path
+        :return: tuple of DirectoryEntry (empty if the directory doesn't exist)
+        """
+        key = DirectoryCache.__normalize(path)
+        with self.__lock:
+            cached = self.__entries.get(key)
+            if cached is None:
+                cached = self.__get_known(key)
+            else:
+                self.__entries.move_to_end(key)
+                if cached[0] == self.__generation:
+                    instrumentation.count("fs.cache_hit")
+                    return cached[2]
+            generation = self.__generation
+
+        mtime = DirectoryCache.__get_mtime(path)
+        listed = False
+        if mtime is None:
+            entries = ()
+        elif cached is not None and cached[1] == mtime:
+            entries = cached[2]
+        else:
+            try:
+                entries = DirectoryCache.__list(path)
+                listed = True
+            except OSError:
+                entries = ()
+
+        with self.__lock:
+            if listed:
+                # Recorded now as the listing may be evicted before it is saved
+                listing = (mtime, [(e.name, e.is_file, e.is_dir) for e in entries])
+                self.__changed[key] = listing
+                if key in self.__known:
+                    self.__known[key] = listing
+            self.__entries[key] = (generation, mtime, entries)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__max_size:
+                self.__entries.popitem(last=False)
+        return entries
+
+    def __len__(self):
+        return len(self.__entries)
@@ -0,0 +1,105 @@
+"""
+Resolve the look and UV status of standins without Maya
+
+Usage : python -m look_loader.HeadlessResolver records.json [-p PROJECT_DIR] [-o status.json] [-j PROCESSES]
+
+records.json is a list of {"object": <object name>, "dso": <dso path>, "plugged": [<include graph filenames>]}
+"""
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from .LookFactory import LookFactory
+from .LookStandin import LookFur
+from .SceneAdapter import MemorySceneAdapter
+
+
+def get_status(look_obj):
+    """
+    Getter of the status of a resolved LookStandin
+    :param look_obj
+    :return: status
+    """
+    return {
+        "object": look_obj.get_object_name(),
+        "standin_name": look_obj.get_standin_name(),
+        "kind": "fur" if isinstance(look_obj, LookFur) else "asset",
+        "looks_up_to_date": look_obj.is_looks_up_to_date(),
+        "versions_behind": look_obj.get_versions_behind(),
+        "uv_up_to_date": look_obj.is_uv_up_to_date(),
+        "looks": {look_name: {"path": look_data[0], "state": look_data[1].name, "versions_behind": look_data[3]}
+                  for look_name, look_data in look_obj.get_looks().items()},
+    }
+
+
+def resolve_records(current_project_dir, records):
+    """
+    Resolve the status of standin records in an in-memory scene
+    :param current_project_dir
+    :param records: list of {"object", "dso", "plugged"}
+    :return: statuses (None for the records that are not valid standins)
+    """
+    scene_adapter = MemorySceneAdapter()
+    standins = [scene_adapter.add_standin(record["object"], record["dso"], record.get("plugged", []))
+                for record in records]
+    # The headless tools only read the project : the persistent publish index of the artists is left untouched
+    look_factory = LookFactory(current_project_dir, scene_adapter=scene_adapter, use_index=False)
+    statuses = []
+    for standin in standins:
+        look_obj = look_factory.generate(standin)
+        statuses.append(get_status(look_obj) if look_obj is not None else None)
+    return statuses
+
+
+def resolve_records_parallel(current_project_dir, records, processes=None, chunk_size=256):
+    """
+    Resolve the status of standin records in a process pool
+    :param current_project_dir
+    :param records
+    :param processes: number of processes (number of cpus if None)
+    :param chunk_size: number of records resolved by a process at once
+    :return: statuses in the order of the records
+    """
+    # Records of the same asset are kept together to share the directory cache of a process
+    order = sorted(range(len(records)), key=lambda i: records[i]["dso"] or "")
+    chunks = [[records[i] for i in order[start:start + chunk_size]] for start in range(0, len(order), chunk_size)]
+    statuses = [None] * len(records)
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        chunk_statuses = executor.map(resolve_records, [current_project_dir] * len(chunks), chunks)
+        for start, chunk_status in zip(range(0, len(order), chunk_size), chunk_statuses):
+            for offset, status in enumerate(chunk_status):
+                statuses[order[start + offset]] = status
+    return statuses
+
+
+def main(argv=None):
+    """
+    Command line entry point
+    :param argv
+    :return: exit code
+    """
+    parser = argparse.ArgumentParser(description="Resolve the look and UV status of standins without Maya")
+    parser.add_argument("records", help="JSON file of the standin records")
+    parser.add_argument("-p", "--project", default=os.getenv("CURRENT_PROJECT_DIR"),
+                        help="Project directory (CURRENT_PROJECT_DIR by default)")
+    parser.add_argument("-o", "--output", help="JSON file of the statuses (stdout by default)")
+    parser.add_argument("-j", "--processes", type=int, default=None, help="Number of processes")
+    args = parser.parse_args(argv)
+    if args.project is None:
+        parser.error("Project directory not found, use --project or CURRENT_PROJECT_DIR")
+
+    with open(args.records, "r") as records_file:
+        records = json.load(records_file)
+    statuses = resolve_records_parallel(args.project, records, args.processes)
+    if args.output is None:
+        json.dump(statuses, sys.stdout, indent=2)
+    else:
+        with open(args.output, "w") as output_file:
+            json.dump(statuses, output_file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
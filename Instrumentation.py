@@ -0,0 +1,159 @@
+import cProfile
+import functools
+import io
+import json
+import logging
+import pstats
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+# Logger of the tool : the warnings go to the handlers of the application (Script Editor in Maya), the per-file debug
+# lines are only written once enabled (ex: logging.getLogger("look_loader").setLevel(logging.DEBUG))
+logger = logging.getLogger("look_loader")
+logger.setLevel(logging.WARNING)
+
+
+class Instrumentation:
+    """
+    Timings of the phases of the tool and counters of the filesystem and scene (DG) calls
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__lock = threading.Lock()
+        self.__spans = {}
+        self.__counters = Counter()
+        self.__profiler = None
+        self.__profile_stats = None
+
+    def reset(self):
+        """
+        Reset the timings and the counters
+        :return:
+        """
+        with self.__lock:
+            self.__spans.clear()
+            self.__counters.clear()
+            self.__profile_stats = None
+
+    @contextmanager
+    def span(self, name):
+        """
+        Context manager timing a phase
+        :param name
+        :return:
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            with self.__lock:
+                calls, total, maximum = self.__spans.get(name, (0, 0.0, 0.0))
+                self.__spans[name] = (calls + 1, total + duration, max(maximum, duration))
+
+    def count(self, name, value=1):
+        """
+        Increment a counter
+        :param name
+        :param value
+        :return:
+        """
+        with self.__lock:
+            self.__counters[name] += value
+
+    def counted(self, name):
+        """
+        Decorator counting the calls of a function
+        :param name: name of the counter
+        :return: decorator
+        """
+        def decorator(function):
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                self.count(name)
+                return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def start_profiling(self):
+        """
+        Start a cProfile capture
+        :return:
+        """
+        if self.__profiler is None:
+            self.__profiler = cProfile.Profile()
+            self.__profiler.enable()
+
+    def stop_profiling(self, nb_lines=30):
+        """
+        Stop the cProfile capture
+        :param nb_lines: number of functions kept in the summary
+        :return: profile summary sorted by cumulative time
+        """
+        if self.__profiler is None:
+            return None
+        self.__profiler.disable()
+        stream = io.StringIO()
+        pstats.Stats(self.__profiler, stream=stream).sort_stats("cumulative").print_stats(nb_lines)
+        self.__profiler = None
+        self.__profile_stats = stream.getvalue()
+        return self.__profile_stats
+
+    def is_profiling(self):
+        """
+        Getter of whether a cProfile capture is running
+        :return: is profiling
+        """
+        return self.__profiler is not None
+
+    def get_summary(self):
+        """
+        Getter of the summary of the timings and the counters
+        :return: summary
+        """
+        with self.__lock:
+            return {
+                "spans": {name: {"calls": calls, "total": total, "max": maximum}
+                          for name, (calls, total, maximum) in sorted(self.__spans.items())},
+                "counters": dict(sorted(self.__counters.items())),
+                "profile": self.__profile_stats,
+            }
+
+    def dump_summary(self, filepath=None):
+        """
+        Dump the summary as JSON
+        :param filepath: file written, None to only return the JSON
+        :return: JSON summary
+        """
+        summary = json.dumps(self.get_summary(), indent=2)
+        if filepath is not None:
+            with open(filepath, "w") as summary_file:
+                summary_file.write(summary)
+        return summary
+
+    def format_summary(self):
+        """
+        Format the summary as text
+        :return: text
+        """
+        summary = self.get_summary()
+        lines = ["%-28s %6s %10s %10s" % ("Phase", "Calls", "Total (s)", "Max (s)")]
+        for name, span in summary["spans"].items():
+            lines.append("%-28s %6d %10.3f %10.3f" % (name, span["calls"], span["total"], span["max"]))
+        lines.append("")
+        lines.append("%-28s %6s" % ("Counter", "Value"))
+        for name, value in summary["counters"].items():
+            lines.append("%-28s %6d" % (name, value))
+        if summary["profile"] is not None:
+            lines.append("")
+            lines.append(summary["profile"])
+        return "\n".join(lines)
+
+
+# Instrumentation shared by the whole tool
+instrumentation = Instrumentation()
@@ -0,0 +1,34 @@
+"""
+Launch of the tool : the window is kept alive when it is closed and shown again on the next launch
+with its standins and caches, the heavy modules are only imported on the first launch
+"""
+import importlib
+
+from shiboken2 import isValid
+
+# Window of the tool kept between the launches
+_look_loader = None
+
+
+def show(reload=False):
+    """
+    Show the window of the tool, reusing the one of the previous launch
+    :param reload: whether the modules of the tool are reloaded and a new window is created
+    :return: window
+    """
+    global _look_loader
+    if reload:
+        if _look_loader is not None and isValid(_look_loader):
+            _look_loader.dispose()
+        _look_loader = None
+        from common import utils
+        utils.unload_packages(silent=True, package=__package__)
+        return importlib.import_module(__name__).show()
+
+    if _look_loader is None or not isValid(_look_loader):
+        from .LookLoader import LookLoader
+        _look_loader = LookLoader()
+    _look_loader.show()
+    _look_loader.raise_()
+    _look_loader.activateWindow()
+    return _look_loader
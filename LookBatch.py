@@ -0,0 +1,138 @@
+import os
+import maya.cmds as cmds
+
+from common.utils import *
+
+from .LookFactory import LookFactory
+from .OperatorChanges import OperatorChanges
+
+# aiStandIn display mode "Bounding Box"
+_STANDIN_MODE_BOUNDING_BOX = 0
+
+
+class StandinBatchEdit:
+    def __init__(self, standins, chunk_name="look_loader_batch"):
+        """
+        Constructor. Context manager grouping the edits of standins in one undo chunk while
+        the standins are displayed as bounding boxes and the viewport refresh is suspended
+        :param standins: aiStandIn shapes edited (DAG paths)
+        :param chunk_name
+        """
+        self.__standins = standins
+        self.__chunk_name = chunk_name
+        self.__modes = {}
+
+    def __enter__(self):
+        cmds.undoInfo(openChunk=True, chunkName=self.__chunk_name)
+        cmds.refresh(suspend=True)
+        try:
+            for standin in self.__standins:
+                mode_attr = str(standin) + ".mode"
+                mode = cmds.getAttr(mode_attr)
+                if mode != _STANDIN_MODE_BOUNDING_BOX:
+                    cmds.setAttr(mode_attr, _STANDIN_MODE_BOUNDING_BOX)
+                    self.__modes[mode_attr] = mode
+        except Exception:
+            # __exit__ is not called when __enter__ fails
+            self.__restore()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.__restore()
+        return False
+
+    def __restore(self):
+        """
+        Restore the display mode of the standins, resume the viewport refresh and close the undo chunk
+        :return:
+        """
+        try:
+            for mode_attr, mode in self.__modes.items():
+                cmds.setAttr(mode_attr, mode)
+        finally:
+            cmds.refresh(suspend=False)
+            cmds.undoInfo(closeChunk=True)
+            cmds.refresh()
+
+
+def update_standins(look_objs, scene_adapter):
+    """
+    Update the UVs and the looks of all the out of date LookStandins in one undo chunk
+    :param look_objs: resolved LookStandins
+    :param scene_adapter: scene adapter of the LookStandins
+    :return: LookStandins updated
+    """
+    to_update = [look_obj for look_obj in look_objs
+                 if not look_obj.is_uv_up_to_date() or not look_obj.is_looks_up_to_date()]
+    if len(to_update) == 0:
+        return []
+    with StandinBatchEdit([look_obj.get_standin() for look_obj in to_update], "look_loader_update_all"):
+        operator_changes = OperatorChanges()
+        looks_updated = []
+        for look_obj in to_update:
+            if not look_obj.is_uv_up_to_date():
+                look_obj.update_uvs()
+            if not look_obj.is_looks_up_to_date():
+                look_obj.update_existent_looks(operator_changes)
+                looks_updated.append(look_obj)
+        scene_adapter.apply_operator_changes(operator_changes)
+        scene_adapter.clear_selection()
+    for look_obj in looks_updated:
+        look_obj.refresh_plugged_looks()
+    return to_update
+
+
+def set_looks(look_objs, look_names, replace_looks, scene_adapter):
+    """
+    Set looks on LookStandins in one undo chunk. The path of a look is taken in the catalog of each LookStandin
+    so that the looks of the same name are set on standins of different assets
+    :param look_objs: resolved LookStandins
+    :param look_names
+    :param replace_looks: whether the other looks of the standins are unplugged
+    :param scene_adapter: scene adapter of the LookStandins
+    :return: LookStandins changed
+    """
+    operator_changes = OperatorChanges()
+    changed = []
+    for look_obj in look_objs:
+        catalog = look_obj.get_catalog()
+        if catalog is None:
+            continue
+        filepath_looks = [catalog.get_path(look_name) for look_name in look_names
+                          if catalog.get_path(look_name) is not None]
+        if len(filepath_looks) == 0:
+            continue
+        nb_changes = len(operator_changes)
+        look_obj.add_looks(filepath_looks, replace_looks, operator_changes)
+        if len(operator_changes) > nb_changes:
+            changed.append(look_obj)
+    if len(changed) == 0:
+        return []
+    with StandinBatchEdit([look_obj.get_standin() for look_obj in changed], "look_loader_set_looks"):
+        scene_adapter.apply_operator_changes(operator_changes)
+        scene_adapter.clear_selection()
+    for look_obj in changed:
+        look_obj.refresh_plugged_looks()
+    return changed
+
+
+def update_all_standins(current_project_dir=None):
+    """
+    Update all the out of date standins of the scene
+    :param current_project_dir: CURRENT_PROJECT_DIR if None
+    :return: LookStandins updated
+    """
+    if current_project_dir is None:
+        current_project_dir = os.getenv("CURRENT_PROJECT_DIR")
+    if current_project_dir is None:
+        print_warning("Current project directory not found", char_filler='-')
+        return []
+    look_factory = LookFactory(current_project_dir)
+    look_objs = []
+    for standin in look_factory.get_scene_adapter().list_standins():
+        look_obj = look_factory.generate(standin)
+        if look_obj is not None:
+            look_objs.append(look_obj)
+    look_factory.save_index()
+    return update_standins(look_objs, look_factory.get_scene_adapter())
@@ -0,0 +1,111 @@
+from .PublishScanner import PublishScanner
+
+
+class LookCatalog:
+    """
+    Immutable catalog of the published looks and UVs of an asset, built once and shared by
+    all the standins instancing the asset
+    """
+
+    __slots__ = ("__asset", "__kind", "__looks", "__paths", "__name_by_path", "__families", "__versions", "__uvs",
+                 "__valid")
+
+    def __init__(self, asset, kind, looks, uvs, valid):
+        """
+        Constructor
+        :param asset
+        :param kind: kind of LookStandin (asset or fur)
+        :param looks: ordered (look name, path)
+        :param uvs: (version, path) sorted from the latest
+        :param valid: whether the standins of the asset are valid
+        """
+        looks = tuple(looks)
+        object.__setattr__(self, "_LookCatalog__asset", asset)
+        object.__setattr__(self, "_LookCatalog__kind", kind)
+        object.__setattr__(self, "_LookCatalog__looks", looks)
+        object.__setattr__(self, "_LookCatalog__paths", {look_name: path for look_name, path in looks})
+        object.__setattr__(self, "_LookCatalog__name_by_path", {path: look_name for look_name, path in looks})
+        families = {}
+        versions = {}
+        for look_name, path in looks:
+            family = PublishScanner.get_look_family(path) if path else None
+            if family is not None:
+                families[family[0]] = look_name
+                versions[look_name] = family[1]
+        object.__setattr__(self, "_LookCatalog__families", families)
+        object.__setattr__(self, "_LookCatalog__versions", versions)
+        object.__setattr__(self, "_LookCatalog__uvs", tuple(uvs))
+        object.__setattr__(self, "_LookCatalog__valid", valid)
+
+    def __setattr__(self, key, value):
+        raise AttributeError("LookCatalog is immutable")
+
+    def get_asset(self):
+        """
+        Getter of the asset name
+        :return: asset
+        """
+        return self.__asset
+
+    def get_kind(self):
+        """
+        Getter of the kind of LookStandin
+        :return: kind
+        """
+        return self.__kind
+
+    def get_looks(self):
+        """
+        Getter of the looks
+        :return: ordered (look name, path)
+        """
+        return self.__looks
+
+    def get_path(self, look_name):
+        """
+        Getter of the path of a look
+        :param look_name
+        :return: path or None
+        """
+        return self.__paths.get(look_name)
+
+    def get_look_name(self, path):
+        """
+        Getter of the name of a look by its path
+        :param path
+        :return: look name or None
+        """
+        return self.__name_by_path.get(path)
+
+    def get_look_name_by_family(self, family):
+        """
+        Getter of the name of the look of a family
+        :param family: family given by PublishScanner.get_look_family
+        :return: look name or None
+        """
+        return self.__families.get(family)
+
+    def get_version(self, look_name):
+        """
+        Getter of the version of a look
+        :param look_name
+        :return: version or None if unversioned
+        """
+        return self.__versions.get(look_name)
+
+    def get_uvs(self):
+        """
+        Getter of the UVs
+        :return: (version, path) sorted from the latest
+        """
+        return self.__uvs
+
+    def is_valid(self):
+        """
+        Getter of whether the standins of the asset are valid
+        :return: is valid
+        """
+        return self.__valid
+
+    def __len__(self):
+        return len(self.__looks)
@@ -1,47 +1,233 @@
 import re
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from .LookStandin import LookAsset, LookFur
+from .DirectoryCache import DirectoryCache
+from .PublishIndexStore import PublishIndexStore
+from .SceneIndex import IncludeGraphIndex
+from .Instrumentation import instrumentation, logger
 from common.utils import *
 
 
 class LookFactory:
-    def __init__(self, current_project_dir):
+    def __init__(self, current_project_dir, dir_cache_size=4096, scene_adapter=None, index_filepath=None,
+                 use_index=True):
         """
         Constructor
         :param current_project_dir
+        :param dir_cache_size: maximum number of directory listings kept in memory
+        :param scene_adapter: SceneAdapter of the standins (the Maya session if None)
+        :param index_filepath: persistent publish index file (default one of the project if None)
+        :param use_index: whether the persistent publish index is used (ignored without project and index file)
         """
+        if scene_adapter is None:
+            from .ApiSceneAdapter import ApiSceneAdapter
+            scene_adapter = ApiSceneAdapter()
+        self.__scene_adapter = scene_adapter
         self.__current_project_dir = current_project_dir
+        self.__dir_cache = DirectoryCache(dir_cache_size)
+        self.__index_store = None
+        # The persistent publish index is loaded in the background on the first generation and saved in the background
+        self.__index_loaded = False
+        self.__index_executor = None
+        # Without project there is no default index to use
+        if use_index and (index_filepath is not None or current_project_dir is not None):
+            if index_filepath is None:
+                index_filepath = PublishIndexStore.get_default_filepath(current_project_dir)
+            self.__index_store = PublishIndexStore(index_filepath)
+            # One worker so that the loads and the saves of the index are done in order
+            self.__index_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="look_loader_index")
+        self.__include_graph_index = None
+        # Catalogs shared by the LookStandins of the same asset {(asset, kind): catalog}
+        self.__catalogs = {}
+        self.__catalogs_lock = threading.Lock()
 
-    def generate(self, standin):
+    def get_dir_cache(self):
+        """
+        Getter of the directory cache shared by all the generated LookStandins
+        :return: dir cache
+        """
+        return self.__dir_cache
+
+    def get_scene_adapter(self):
+        """
+        Getter of the scene adapter
+        :return: scene adapter
+        """
+        return self.__scene_adapter
+
+    def get_include_graph_index(self):
+        """
+        Getter of the index of the include graphs plugged on the standins generated, reset on each refresh
+        :return: include graph index
+        """
+        if self.__include_graph_index is None:
+            self.__include_graph_index = IncludeGraphIndex(self.__scene_adapter)
+        return self.__include_graph_index
+
+    def refresh(self):
+        """
+        Start a new refresh : the cached directories will be checked against their mtime once more
+        and the standins and the include graphs of the scene will be read again
+        :return:
+        """
+        self.__dir_cache.refresh()
+        self.__scene_adapter.refresh()
+        self.__include_graph_index = None
+        with self.__catalogs_lock:
+            self.__catalogs.clear()
+
+    def save_index(self):
+        """
+        Write the directories listed again since the last save in the persistent publish index, in the background
+        :return: future of the save or None if there is nothing to save
+        """
+        if self.__index_store is None:
+            return None
+        changed = self.__dir_cache.pop_changed()
+        if len(changed) == 0:
+            return None
+        return self.__index_executor.submit(self.__save_index_job, changed)
+
+    def __save_index_job(self, changed):
+        """
+        Job of the index worker writing listings in the persistent publish index
+        :param changed: {directory: (mtime, [(name, is_file, is_dir)])}
+        :return:
+        """
+        try:
+            with instrumentation.span("LookFactory.save_index"):
+                self.__index_store.save(changed)
+        except Exception as e:
+            logger.warning("Publish index could not be saved : %s", e)
+
+    def invalidate(self, path=None):
+        """
+        Invalidate the directory cache and the catalogs of the assets concerned
+        :param path: directory to invalidate, None to invalidate everything
+        :return:
+        """
+        self.__dir_cache.invalidate(path)
+        with self.__catalogs_lock:
+            if path is None or self.__current_project_dir is None:
+                self.__catalogs.clear()
+                return
+            assets_dir = os.path.join(self.__current_project_dir, "assets").replace("\\", "/") + "/"
+            relative_path = path.replace("\\", "/")
+            if not relative_path.startswith(assets_dir):
+                return
+            asset = relative_path[len(assets_dir):].split("/")[0]
+            for key in [key for key in self.__catalogs.keys() if key[0] == asset]:
+                del self.__catalogs[key]
+
+    def resolve(self, look_obj):
+        """
+        Resolve the filesystem part of a LookStandIn (safe to call in a worker thread). The catalog is
+        built once per asset and shared by all its LookStandIns until the next refresh
+        :param look_obj
+        :return: catalog to apply in the main thread
+        """
+        key = look_obj.get_catalog_key()
+        with self.__catalogs_lock:
+            catalog = self.__catalogs.get(key)
+        if catalog is not None:
+            instrumentation.count("catalog.hit")
+            return catalog
+        catalog = look_obj.resolve(self.__current_project_dir)
+        with self.__catalogs_lock:
+            return self.__catalogs.setdefault(key, catalog)
+
+    def generate(self, standin, resolve=True):
         """
         Generate a LookStandIn according to the StandIn
         :param standin
+        :param resolve: whether the looks and the UVs are resolved right away
         :return: LookStandIn
         """
-        standin_trsf = standin.getParent()
-        trsf_name = standin_trsf.name()
-        object_name = trsf_name
+        with instrumentation.span("LookFactory.generate"):
+            self.__load_index()
+            return self.__generate(standin, resolve)
 
-        # standin name
-        standin_file_path = standin.dso.get()
-        if standin_file_path is None:
+    def __load_index(self):
+        """
+        Load the persistent publish index in the directory cache in the background if not loaded yet. The directories
+        listed before it is loaded are simply listed from the filesystem
+        :return:
+        """
+        if self.__index_loaded:
             return
+        self.__index_loaded = True
+        if self.__index_store is not None:
+            self.__index_executor.submit(self.__load_index_job)
+
+    def __load_index_job(self):
+        """
+        Job of the index worker loading the persistent publish index in the directory cache
+        :return:
+        """
+        try:
+            with instrumentation.span("LookFactory.load_index"):
+                self.__dir_cache.load(self.__index_store.load())
+        except Exception as e:
+            logger.warning("Publish index could not be loaded : %s", e)
+
+    @staticmethod
+    def __parse_dso(standin_file_path):
+        """
+        Find the asset of a standin from its dso
+        :param standin_file_path: dso
+        :return: (LookStandin class, standin name) or None if the dso is not of an asset
+        """
+        if standin_file_path is None:
+            return None
         match = re.match(r"^.*[\\/](abc|abc_fur)[\\/].*?(?:(.+)_mod\.v[0-9]{3}|(\w+)_[0-9]{2}_fur)\.abc$",
                          standin_file_path)
         if match is None:
             return None
-
         if match.group(1) == "abc_fur":
-            standin_name = match.group(3)
-            look_obj = LookFur(standin, standin_name, object_name)
-        else:
-            standin_name = match.group(2)
-            look_obj = LookAsset(standin, standin_name, object_name)
+            return LookFur, match.group(3)
+        return LookAsset, match.group(2)
+
+    def __generate(self, standin, resolve):
+        """
+        Generate a LookStandIn according to the StandIn
+        :param standin
+        :param resolve
+        :return: LookStandIn
+        """
+        object_name = self.__scene_adapter.get_object_name(standin)
+
+        # standin name
+        parsed = LookFactory.__parse_dso(self.__scene_adapter.get_dso(standin))
+        if parsed is None:
+            return None
+        look_class, standin_name = parsed
+        look_obj = look_class(standin, standin_name, object_name, self.__dir_cache,
+                              self.get_include_graph_index(), self.__scene_adapter)
+
+        if not resolve:
+            return look_obj
 
         # Retrieve the looks
-        look_obj.retrieve_looks(self.__current_project_dir)
-        look_obj.retrieve_uvs(self.__current_project_dir)
+        look_obj.apply_resolution(self.resolve(look_obj))
 
         if look_obj.is_valid():
             return look_obj
 
         return None
+
+    def refresh_look_obj(self, look_obj):
+        """
+        Bring a LookStandIn generated before the last refresh up to date with the scene (main thread only).
+        It is generated again if its dso is not of the same asset anymore, otherwise its plugged looks are read
+        again from the index of this refresh
+        :param look_obj
+        :return: LookStandIn (None if the standin is not of an asset anymore)
+        """
+        standin = look_obj.get_standin()
+        parsed = LookFactory.__parse_dso(self.__scene_adapter.get_dso(standin))
+        if parsed != (type(look_obj), look_obj.get_standin_name()):
+            return self.generate(standin, resolve=False)
+        look_obj.refresh_plugged_looks(self.get_include_graph_index())
+        return look_obj
@@ -1,18 +1,12 @@
 import os
-import sys
-import re
 
-from functools import partial
-
-import pymel.core as pm
 import maya.OpenMayaUI as omui
 
-from PySide2 import QtCore
-from PySide2 import QtGui
-from PySide2 import QtWidgets
-from PySide2.QtWidgets import *
-from PySide2.QtCore import *
-from PySide2.QtGui import *
+from PySide2.QtCore import Qt, QEvent, QItemSelection, QItemSelectionModel, QPoint, QTimer
+from PySide2.QtGui import QCloseEvent, QColor, QCursor, QShowEvent
+from PySide2.QtWidgets import QAbstractItemView, QApplication, QDesktopWidget, QDialog, QFileDialog, QGridLayout, \
+    QGroupBox, QHBoxLayout, QHeaderView, QLabel, QListWidget, QListWidgetItem, QMenu, QMessageBox, QPlainTextEdit, \
+    QPushButton, QRadioButton, QSizePolicy, QTableView, QToolTip, QVBoxLayout, QWidget
 
 from shiboken2 import wrapInstance
 
@@ -21,21 +15,36 @@ from common.utils import *
 from common.Prefs import *
 
 import maya.OpenMaya as OpenMaya
+import maya.utils
 
 from .LookStandin import LookAsset, LookPresentState
-from .LookFactory import LookFactory
+from .AssInspector import ass_inspector
+from . import ScenePreWarm
+from .LookResolver import LookResolver
+from .StandinTableModel import StandinTableModel, UpdateButtonDelegate
+from .Instrumentation import instrumentation
+from .PublishWatcher import PublishWatcher
 
 # ######################################################################################################################
 
 _FILE_NAME_PREFS = "look_loader"
 
+# Delay in ms before the selection changes are handled
+_DEFAULT_SELECTION_REFRESH_DELAY = 150
+# Delay in ms to gather the resolutions before refreshing the table
+_RESOLUTION_REFRESH_DELAY = 50
+# Interval in ms of the polling of the publish directories (0 to disable it)
+_DEFAULT_PUBLISH_POLL_INTERVAL = 5000
+
 
 # ######################################################################################################################
 
 
 class LookLoader(QDialog):
 
-    def __init__(self, prnt=wrapInstance(int(omui.MQtUtil.mainWindow()), QWidget)):
+    def __init__(self, prnt=None):
+        if prnt is None:
+            prnt = wrapInstance(int(omui.MQtUtil.mainWindow()), QWidget)
         super(LookLoader, self).__init__(prnt)
 
         # Common Preferences (common preferences on all tools)
@@ -45,14 +54,29 @@ class LookLoader(QDialog):
 
         # Model attributes
         self.__standins = {}
+        self.__standins_by_shape = {}
+        self.__standins_resolved = set()
+        self.__standins_removed = False
         self.__refresh_selection = True
         self.__standin_obj_selected = None
-        self.__file_looks_selected = []
+        self.__standin_objs_selected = []
+        self.__look_names_selected = []
+        # Looks being validated by the workers {look name: look path}
+        self.__looks_validating = None
         self.__selection_callback = None
+        self.__scene_callbacks = []
         self.__replace_looks = False
+        self.__selection_refresh_delay = _DEFAULT_SELECTION_REFRESH_DELAY
+        self.__publish_poll_interval = _DEFAULT_PUBLISH_POLL_INTERVAL
 
         self.__retrieve_current_project_dir()
-        self.__look_factory = LookFactory(self.__current_project_dir)
+        # The factory and the standins warmed when the scene was opened are picked up
+        self.__look_factory = ScenePreWarm.get_look_factory(self.__current_project_dir)
+        self.__standins_by_shape = ScenePreWarm.take_standins(self.__current_project_dir)
+        self.__look_resolver = LookResolver(self.__look_factory, parent=self)
+        self.__look_resolver.resolved.connect(self.__on_standin_resolved)
+        self.__look_resolver.inspected.connect(self.__on_look_inspected)
+        self.__look_resolver.validated.connect(self.__on_looks_validated)
 
         # UI attributes
         self.__ui_width = 700
@@ -63,15 +87,37 @@ class LookLoader(QDialog):
 
         self.__retrieve_prefs()
 
+        # Watch the publish directories of the assets in use
+        self.__publish_watcher = PublishWatcher(self.__current_project_dir, self.__publish_poll_interval, self)
+        self.__publish_watcher.assets_changed.connect(self.__on_publish_changed)
+
+        # The standins of the previous scene are forgotten when another scene is opened
+        for message in [OpenMaya.MSceneMessage.kAfterOpen, OpenMaya.MSceneMessage.kAfterNew]:
+            self.__scene_callbacks.append(OpenMaya.MSceneMessage.addCallback(message, self.__on_scene_opened))
+
         # name the window
         self.setWindowTitle("Look Loader")
         # make the window a "tool" in Maya's eyes so that it stays on top when you click off
-        self.setWindowFlags(QtCore.Qt.Tool)
-        # Makes the object get deleted from memory, not just hidden, when it is closed.
-        self.setAttribute(QtCore.Qt.WA_DeleteOnClose)
-
-        # retrieve datas
-        self.__retrieve_standins()
+        self.setWindowFlags(Qt.Tool)
+        # The window is only hidden when it is closed so that it is reused with its caches on the next launch
+
+        # Selection changes are coalesced and handled once the scene is idle
+        self.__selection_refresh_timer = QTimer(self)
+        self.__selection_refresh_timer.setSingleShot(True)
+        self.__selection_refresh_timer.setInterval(self.__selection_refresh_delay)
+        self.__selection_refresh_timer.timeout.connect(self.__on_selection_refresh_timeout)
+
+        # Resolutions arriving from the workers are gathered before refreshing the table
+        self.__resolution_refresh_timer = QTimer(self)
+        self.__resolution_refresh_timer.setSingleShot(True)
+        self.__resolution_refresh_timer.setInterval(_RESOLUTION_REFRESH_DELAY)
+        self.__resolution_refresh_timer.timeout.connect(self.__on_resolution_refresh_timeout)
+
+        # The standins are resolved once their row is visible, gathered after scrolls and resizes
+        self.__visible_resolve_timer = QTimer(self)
+        self.__visible_resolve_timer.setSingleShot(True)
+        self.__visible_resolve_timer.setInterval(0)
+        self.__visible_resolve_timer.timeout.connect(self.__resolve_visible_standins)
 
         # Create the layout, linking it to actions and refresh the display
         self.__create_ui()
@@ -87,6 +133,8 @@ class LookLoader(QDialog):
         pos = self.pos()
         self.__prefs["window_pos"] = {"x": pos.x(), "y": pos.y()}
         self.__prefs["replace_looks"] = self.__replace_looks
+        self.__prefs["selection_refresh_delay"] = self.__selection_refresh_delay
+        self.__prefs["publish_poll_interval"] = self.__publish_poll_interval
 
     def __retrieve_prefs(self):
         """
@@ -105,13 +153,22 @@ class LookLoader(QDialog):
         if "replace_looks" in self.__prefs:
             self.__replace_looks = self.__prefs["replace_looks"]
 
+        if "selection_refresh_delay" in self.__prefs:
+            self.__selection_refresh_delay = self.__prefs["selection_refresh_delay"]
+
+        if "publish_poll_interval" in self.__prefs:
+            self.__publish_poll_interval = self.__prefs["publish_poll_interval"]
+
     def showEvent(self, arg__1: QShowEvent) -> None:
         """
-        Create callback
+        Create callback and retrieve the standins once the window is shown
         :return:
         """
         self.__selection_callback = \
             OpenMaya.MEventMessage.addEventCallback("SelectionChanged", self.__on_scene_selection_changed)
+        self.__publish_watcher.resume()
+        # The standins already known keep their resolution when the window is shown again
+        self.__selection_refresh_timer.start(0)
 
     def hideEvent(self, arg__1: QCloseEvent) -> None:
         """
@@ -119,8 +176,51 @@ class LookLoader(QDialog):
         :return:
         """
         OpenMaya.MMessage.removeCallback(self.__selection_callback)
+        self.__selection_refresh_timer.stop()
+        self.__look_resolver.cancel_all()
+        self.__publish_watcher.pause()
+        self.__look_factory.save_index()
         self.__save_prefs()
 
+    def dispose(self):
+        """
+        Stop the resolution workers and the watcher and delete the window
+        :return:
+        """
+        self.close()
+        for scene_callback in self.__scene_callbacks:
+            OpenMaya.MMessage.removeCallback(scene_callback)
+        self.__scene_callbacks = []
+        self.__look_resolver.shutdown()
+        if self.__looks_validating is not None:
+            self.__looks_validating = None
+            QApplication.restoreOverrideCursor()
+        self.__publish_watcher.stop()
+        self.deleteLater()
+
+    def eventFilter(self, watched, event) -> bool:
+        """
+        Resolve the standins that become visible when the table is resized and show the summary of the look hovered
+        :param watched
+        :param event
+        :return: whether the event is filtered
+        """
+        if event.type() == QEvent.Resize:
+            self.__visible_resolve_timer.start()
+        elif event.type() == QEvent.ToolTip and watched is self.__ui_looks_list.viewport():
+            # The .ass file of the look is inspected by the workers when it is hovered, the last summary known
+            # is shown meanwhile
+            item = self.__ui_looks_list.itemAt(event.pos())
+            if item is None:
+                QToolTip.hideText()
+                return True
+            path = item.data(Qt.UserRole)
+            summary = ass_inspector.get_cached(path)
+            self.__look_resolver.inspect(path)
+            QToolTip.showText(event.globalPos(), summary.format() if summary is not None else "Inspecting…", watched)
+            return True
+        return super(LookLoader, self).eventFilter(watched, event)
+
     def __retrieve_current_project_dir(self):
         """
         Retrieve the current project dir specified in the Illogic maya launcher
@@ -172,15 +272,29 @@ class LookLoader(QDialog):
         grid_layout.addWidget(QLabel("Looks"), 0, 1, alignment=Qt.AlignCenter)
 
         # Standin Table
-        self.__ui_standin_table = QTableWidget(0, 4)
-        self.__ui_standin_table.setHorizontalHeaderLabels(["Name", "Standin Name", "Number looks", "UVs"])
+        self.__standin_table_model = StandinTableModel(self)
+        self.__ui_standin_table = QTableView()
+        self.__ui_standin_table.setModel(self.__standin_table_model)
         self.__ui_standin_table.setSizePolicy(QSizePolicy.Minimum, QSizePolicy.Preferred)
         self.__ui_standin_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         self.__ui_standin_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.__ui_standin_table.verticalHeader().hide()
-        self.__ui_standin_table.setSelectionMode(QAbstractItemView.SingleSelection)
-        self.__ui_standin_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.__ui_standin_table.itemSelectionChanged.connect(self.__on_standin_select_changed)
+        self.__ui_standin_table.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.__ui_standin_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        # Sorted on a click on a header, the standins keep the order of the scene until then
+        self.__ui_standin_table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.__ui_standin_table.setSortingEnabled(True)
+        self.__ui_standin_table.selectionModel().selectionChanged.connect(self.__on_standin_select_changed)
+        # The Update buttons are drawn by a delegate instead of a widget per row
+        self.__ui_update_uv_delegate = UpdateButtonDelegate(self.__ui_standin_table)
+        self.__ui_update_uv_delegate.update_clicked.connect(self.__on_update_uv_clicked)
+        self.__ui_standin_table.setItemDelegateForColumn(StandinTableModel.UV_COLUMN, self.__ui_update_uv_delegate)
+        self.__ui_standin_table.verticalScrollBar().valueChanged.connect(self.__visible_resolve_timer.start)
+        self.__ui_standin_table.viewport().installEventFilter(self)
+        self.__standin_table_model.rowsInserted.connect(self.__visible_resolve_timer.start)
+        self.__standin_table_model.rowsRemoved.connect(self.__visible_resolve_timer.start)
+        self.__standin_table_model.modelReset.connect(self.__visible_resolve_timer.start)
+        self.__standin_table_model.layoutChanged.connect(self.__visible_resolve_timer.start)
         grid_layout.addWidget(self.__ui_standin_table, 1, 0, 2,1)
 
         # List of Looks
@@ -189,6 +303,9 @@ class LookLoader(QDialog):
         self.__ui_looks_list.setStyleSheet("font-size:14px")
         self.__ui_looks_list.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.__ui_looks_list.itemSelectionChanged.connect(self.__on_look_selected_changed)
+        self.__ui_looks_list.viewport().installEventFilter(self)
+        self.__ui_looks_list.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.__ui_looks_list.customContextMenuRequested.connect(self.__on_looks_context_menu)
         grid_layout.addWidget(self.__ui_looks_list, 1, 1)
 
         # Toggle replace
@@ -201,6 +318,39 @@ class LookLoader(QDialog):
         self.__ui_add_looks_to_standin_btn.clicked.connect(self.__on_add_looks_to_standin)
         main_lyt.addWidget(self.__ui_add_looks_to_standin_btn)
 
+        self.__ui_update_all_btn = QPushButton("Update all StandIns")
+        self.__ui_update_all_btn.setToolTip("Update the UVs and the looks of all the out of date StandIns listed")
+        self.__ui_update_all_btn.clicked.connect(self.__on_update_all_standins)
+        main_lyt.addWidget(self.__ui_update_all_btn)
+
+        # Instrumentation panel (hidden until checked)
+        self.__ui_instrumentation_grp = QGroupBox("Instrumentation")
+        self.__ui_instrumentation_grp.setCheckable(True)
+        self.__ui_instrumentation_grp.setChecked(False)
+        instrumentation_lyt = QVBoxLayout(self.__ui_instrumentation_grp)
+        instrumentation_btn_lyt = QHBoxLayout()
+        instrumentation_lyt.addLayout(instrumentation_btn_lyt)
+        instrumentation_refresh_btn = QPushButton("Refresh")
+        instrumentation_refresh_btn.clicked.connect(self.__refresh_instrumentation)
+        instrumentation_btn_lyt.addWidget(instrumentation_refresh_btn)
+        instrumentation_reset_btn = QPushButton("Reset")
+        instrumentation_reset_btn.clicked.connect(self.__on_reset_instrumentation)
+        instrumentation_btn_lyt.addWidget(instrumentation_reset_btn)
+        self.__ui_profile_btn = QPushButton("Profile")
+        self.__ui_profile_btn.setCheckable(True)
+        self.__ui_profile_btn.toggled.connect(self.__on_profile_toggled)
+        instrumentation_btn_lyt.addWidget(self.__ui_profile_btn)
+        instrumentation_save_btn = QPushButton("Save JSON")
+        instrumentation_save_btn.clicked.connect(self.__on_save_instrumentation)
+        instrumentation_btn_lyt.addWidget(instrumentation_save_btn)
+        self.__ui_instrumentation_txt = QPlainTextEdit()
+        self.__ui_instrumentation_txt.setReadOnly(True)
+        self.__ui_instrumentation_txt.setStyleSheet("font-family:monospace")
+        instrumentation_lyt.addWidget(self.__ui_instrumentation_txt)
+        self.__ui_instrumentation_grp.toggled.connect(self.__on_instrumentation_toggled)
+        self.__on_instrumentation_toggled(False)
+        main_lyt.addWidget(self.__ui_instrumentation_grp)
+
     def __refresh_ui(self):
         """
         Refresh the ui according to the model attribute
@@ -216,55 +366,36 @@ class LookLoader(QDialog):
         :return:
         """
         self.__ui_add_looks_to_standin_btn.setEnabled(self.__standin_obj_selected is not None and
-                                                      len(self.__file_looks_selected) > 0)
+                                                      self.__standin_obj_selected.is_resolved() and
+                                                      len(self.__look_names_selected) > 0)
+        nb_standins_selected = len(self.__standin_objs_selected)
+        if nb_standins_selected > 1:
+            self.__ui_add_looks_to_standin_btn.setText("Set Looks to the " + str(nb_standins_selected) + " StandIns")
+        else:
+            self.__ui_add_looks_to_standin_btn.setText("Set Looks to the StandIn")
 
-    def __refresh_standin_table(self):
+    def __refresh_standin_table(self, standins_changed=None):
         """
         Refresh the standin table
+        :param standins_changed: only refresh the rows of these standins if specified
         :return:
         """
-        refresh_selection = self.__refresh_selection
-        self.__refresh_selection = False
-        self.__ui_standin_table.setRowCount(0)
-        row_index = 0
-        row_selected = None
-        for standin_obj in self.__standins.values():
-            self.__ui_standin_table.insertRow(row_index)
-
-            if standin_obj is self.__standin_obj_selected:
-                row_selected = row_index
-
-            object_name = standin_obj.get_object_name()
-            standin_name = standin_obj.get_standin_name()
-
-            object_name_item = QTableWidgetItem(object_name)
-            object_name_item.setData(Qt.UserRole, standin_obj)
-            self.__ui_standin_table.setItem(row_index, 0, object_name_item)
-
-            standin_name_item = QTableWidgetItem(standin_name)
-            standin_name_item.setTextAlignment(Qt.AlignCenter)
-            self.__ui_standin_table.setItem(row_index, 1, standin_name_item)
-
-            nb_looks = len(standin_obj.get_looks())
-            nb_looks_item = QTableWidgetItem(str(nb_looks))
-            nb_looks_item.setTextAlignment(Qt.AlignCenter)
-            self.__ui_standin_table.setItem(row_index, 2, nb_looks_item)
-
-            if standin_obj.is_uv_up_to_date():
-                up_to_date_lbl = QTableWidgetItem("Up to date")
-                up_to_date_lbl.setTextAlignment(Qt.AlignCenter)
-                self.__ui_standin_table.setItem(row_index, 3, up_to_date_lbl)
+        with instrumentation.span("LookLoader.__refresh_standin_table"):
+            refresh_selection = self.__refresh_selection
+            self.__refresh_selection = False
+            if standins_changed is None:
+                self.__standin_table_model.set_standins(list(self.__standins.values()))
+                selection = QItemSelection()
+                self.__standin_objs_selected = [standin_obj for standin_obj in self.__standin_objs_selected
+                                                if self.__standin_table_model.get_row(standin_obj) is not None]
+                for standin_obj in self.__standin_objs_selected:
+                    row = self.__standin_table_model.get_row(standin_obj)
+                    selection.select(self.__standin_table_model.index(row, 0), self.__standin_table_model.index(row, 0))
+                self.__ui_standin_table.selectionModel().select(
+                    selection, QItemSelectionModel.ClearAndSelect | QItemSelectionModel.Rows)
             else:
-                update_uv_btn = QPushButton("Update")
-                update_uv_btn.setStyleSheet("margin:3px")
-                update_uv_btn.clicked.connect(standin_obj.update_uvs)
-                update_uv_btn.clicked.connect(self.__refresh_standin_table)
-                self.__ui_standin_table.setCellWidget(row_index, 3, update_uv_btn)
-
-            row_index += 1
-        if row_selected is not None:
-            self.__ui_standin_table.selectRow(row_selected)
-        self.__refresh_selection = refresh_selection
+                self.__standin_table_model.refresh_standins(standins_changed)
+            self.__refresh_selection = refresh_selection
 
     def __refresh_looks_list(self):
         """
@@ -283,41 +414,154 @@ class LookLoader(QDialog):
                 elif look_data[1] == LookPresentState.AnteriorVersionPlugged:
                     look_list_widget.setTextColor(QColor(255, 255, 0).rgba())
 
-    def __retrieve_standins(self):
+    def __retrieve_standin_shapes(self):
+        """
+        Retrieve the standin shapes : all standins if selection is None
+        or all standins within selection
+        :return: standin shapes (standins of the scene adapter)
+        """
+        scene_adapter = self.__look_factory.get_scene_adapter()
+        # One query on the whole selection, each standin once
+        shapes = scene_adapter.list_selected_standins()
+        if shapes is None:
+            # One pass on the standins of the scene
+            shapes = scene_adapter.list_standins()
+        return shapes
+
+    def __retrieve_standins(self, only_selection_diff=False):
         """
         Retrieve the standins : all valid standin if selection is None
         or all valid standins within selection
+        :param only_selection_diff: only generate the standins that entered the selection since the last pass, the
+        others keep their resolution but are brought up to date with the scene
         :return:
         """
-        self.__standins.clear()
-        selection = pm.ls(selection=True)
-        if len(selection) > 0:
-            for sel in selection:
-                if pm.objectType(sel, isType="aiStandIn"):
-                    # Standin found
-                    look_obj = self.__look_factory.generate(sel)
-                    if look_obj is not None: self.__standins[look_obj.get_object_name()] = look_obj
-                elif pm.objectType(sel, isType="transform"):
-                    prt = sel.getParent()
-                    if prt is not None and pm.objectType(prt, isType="transform"):
-                        shape = prt.getShape()
-                        if shape is not None and pm.objectType(shape, isType="aiStandIn"):
-                            # Proxy of Standin found
-                            look_obj = self.__look_factory.generate(shape)
-                            if look_obj is not None: self.__standins[look_obj.get_object_name()] = look_obj
-
-                for rel in pm.listRelatives(sel, allDescendents=True, type="aiStandIn"):
-                    look_obj = self.__look_factory.generate(rel)
-                    if look_obj is not None: self.__standins[look_obj.get_object_name()] = look_obj
-        else:
-            for standin in pm.ls(type="aiStandIn"):
-                if standin.name().startswith("frame"):
+        with instrumentation.span("LookLoader.__retrieve_standins"):
+            self.__look_factory.refresh()
+            standins_by_shape = {}
+            for shape in self.__retrieve_standin_shapes():
+                if shape in standins_by_shape:
                     continue
-                look_obj = self.__look_factory.generate(standin)
+                previous = self.__standins_by_shape.get(shape) if only_selection_diff else None
+                if previous is not None:
+                    # The dso or the operators may have been changed outside of the tool (undo, manual edits)
+                    standins_by_shape[shape] = self.__look_factory.refresh_look_obj(previous)
+                else:
+                    # Only the dso is read here, the looks are resolved by the workers once visible
+                    standins_by_shape[shape] = self.__look_factory.generate(shape, resolve=False)
+            self.__standins_by_shape = standins_by_shape
+
+            self.__standins.clear()
+            for look_obj in self.__standins_by_shape.values():
                 if look_obj is not None: self.__standins[look_obj.get_object_name()] = look_obj
+            self.__standins = dict(sorted(self.__standins.items()))
+            self.__publish_watcher.set_assets({look_obj.get_standin_name() for look_obj in self.__standins.values()})
 
-        self.__standins = dict(sorted(self.__standins.items()))
+    def __on_standin_resolved(self, look_obj, resolution):
+        """
+        On the filesystem resolution of a standin done by a worker
+        :param look_obj
+        :param resolution
+        :return:
+        """
+        self.__look_resolver.take(look_obj)
+        if self.__standins.get(look_obj.get_object_name()) is not look_obj:
+            # The standin is not displayed anymore
+            return
+        if resolution is not None:
+            # The plugged looks are retrieved here in the main thread
+            look_obj.apply_resolution(resolution)
+        if resolution is None or not look_obj.is_valid():
+            del self.__standins[look_obj.get_object_name()]
+            for shape, obj in self.__standins_by_shape.items():
+                if obj is look_obj:
+                    self.__standins_by_shape[shape] = None
+                    break
+            self.__standins_removed = True
+        self.__standins_resolved.add(look_obj)
+        self.__resolution_refresh_timer.start()
+
+    def __on_look_inspected(self, path, summary):
+        """
+        On the summary of a look file done by a worker : shown if the look is still hovered
+        :param path
+        :param summary
+        :return:
+        """
+        self.__look_resolver.take_inspection(path)
+        if not QToolTip.isVisible():
+            return
+        viewport = self.__ui_looks_list.viewport()
+        item = self.__ui_looks_list.itemAt(viewport.mapFromGlobal(QCursor.pos()))
+        if item is None or item.data(Qt.UserRole) != path:
+            return
+        text = summary.format() if summary is not None else "The look file can't be read"
+        QToolTip.showText(QCursor.pos(), text, viewport)
 
+    def __resolve_visible_standins(self):
+        """
+        Resolve the standins of the visible rows and the selected one, the others are resolved on demand
+        :return:
+        """
+        nb_rows = self.__standin_table_model.rowCount()
+        if nb_rows == 0:
+            return
+        first_row = self.__ui_standin_table.rowAt(0)
+        last_row = self.__ui_standin_table.rowAt(self.__ui_standin_table.viewport().height() - 1)
+        first_row = 0 if first_row < 0 else first_row
+        last_row = nb_rows - 1 if last_row < 0 else last_row
+        to_resolve = [self.__standin_table_model.get_standin(row) for row in range(first_row, last_row + 1)]
+        if self.__standin_obj_selected is not None:
+            to_resolve.insert(0, self.__standin_obj_selected)
+        # Rows scrolled out of view don't need to be resolved before the visible ones
+        self.__look_resolver.cancel_all()
+        for look_obj in to_resolve:
+            if not look_obj.is_resolved():
+                self.__look_resolver.submit(look_obj)
+
+    def __on_publish_changed(self, assets):
+        """
+        On new files published for assets in use : only their standins are resolved again
+        :param assets: asset names
+        :return:
+        """
+        for asset in assets:
+            for directory in self.__publish_watcher.get_dirs(asset):
+                self.__look_factory.invalidate(directory)
+        standins_changed = []
+        for look_obj in self.__standins.values():
+            # The standins not resolved yet will see the new files when they are
+            if look_obj.get_standin_name() in assets and look_obj.is_resolved():
+                look_obj.invalidate_resolution()
+                standins_changed.append(look_obj)
+        self.__refresh_standin_table(standins_changed)
+        self.__visible_resolve_timer.start()
+        # New sublook folders have to be watched too
+        self.__publish_watcher.rescan(assets)
+
+    def __on_resolution_refresh_timeout(self):
+        """
+        Refresh the rows of the resolutions gathered
+        :return:
+        """
+        standins_resolved = self.__standins_resolved
+        self.__standins_resolved = set()
+        if self.__standins_removed:
+            self.__standins_removed = False
+            self.__refresh_standin_table()
+        self.__refresh_standin_table(standins_resolved)
+        if self.__standin_obj_selected in standins_resolved:
+            self.__on_standin_select_changed()
+
+    def __on_update_uv_clicked(self, index):
+        """
+        On Update button clicked in the standin table
+        :param index
+        :return:
+        """
+        standin_obj = self.__standin_table_model.get_standin(index.row())
+        standin_obj.update_uvs()
+        self.__refresh_standin_table([standin_obj])
 
     def __on_replace_looks_checked(self, state):
         self.__replace_looks = state
@@ -330,20 +574,58 @@ class LookLoader(QDialog):
         :return:
         """
         if self.__refresh_selection:
-            self.__retrieve_standins()
+            # Restart the timer so that a burst of events is handled once
+            self.__selection_refresh_timer.start(self.__selection_refresh_delay)
+
+    def __on_scene_opened(self, *args):
+        """
+        On a scene opened or a new scene : handled once Maya is idle, after the pre-warm of the scene
+        :param args
+        :return:
+        """
+        maya.utils.executeDeferred(self.__reset_standins)
+
+    def __reset_standins(self):
+        """
+        Forget the standins of the previous scene and pick up the ones pre-warmed for the new scene
+        :return:
+        """
+        self.__look_resolver.cancel_all()
+        self.__standins.clear()
+        self.__standins_resolved.clear()
+        self.__standin_obj_selected = None
+        self.__standin_objs_selected = []
+        self.__standins_by_shape = ScenePreWarm.take_standins(self.__current_project_dir)
+        if self.isVisible():
+            self.__selection_refresh_timer.start(0)
+
+    def __on_selection_refresh_timeout(self):
+        """
+        Handle the selection changes coalesced by the timer
+        :return:
+        """
+        if self.__refresh_selection:
+            self.__retrieve_standins(only_selection_diff=True)
             self.__refresh_standin_table()
+            # The rows kept may have changed in the scene
+            self.__refresh_standin_table(list(self.__standins.values()))
             self.__on_standin_select_changed()
 
-    def __on_standin_select_changed(self):
+    def __on_standin_select_changed(self, *args):
         """
         On standin selected changed in standin table
+        :param args
         :return:
         """
         if self.__refresh_selection:
-            rows_selected = self.__ui_standin_table.selectionModel().selectedRows()
-            if len(rows_selected) > 0:
-                row_selected = rows_selected[0]
-                self.__standin_obj_selected = self.__ui_standin_table.item(row_selected.row(), 0).data(Qt.UserRole)
+            rows_selected = sorted(index.row() for index in self.__ui_standin_table.selectionModel().selectedRows())
+            self.__standin_objs_selected = [self.__standin_table_model.get_standin(row) for row in rows_selected]
+            if len(self.__standin_objs_selected) > 0:
+                # The looks listed are the ones of the first standin selected
+                self.__standin_obj_selected = self.__standin_objs_selected[0]
+                for standin_obj in self.__standin_objs_selected:
+                    if not standin_obj.is_resolved():
+                        self.__look_resolver.submit(standin_obj)
             else:
                 self.__standin_obj_selected = None
             self.__refresh_looks_list()
@@ -354,20 +636,160 @@ class LookLoader(QDialog):
         On Look selected changed in Look list
         :return:
         """
-        self.__file_looks_selected.clear()
+        self.__look_names_selected.clear()
         selected_items = self.__ui_looks_list.selectedItems()
         for item in selected_items:
-            self.__file_looks_selected.append(item.data(Qt.UserRole))
+            self.__look_names_selected.append(item.text())
         self.__refresh_btn()
 
+    def __on_looks_context_menu(self, pos):
+        """
+        Show the actions on the looks selected
+        :param pos
+        :return:
+        """
+        if len(self.__ui_looks_list.selectedItems()) == 0:
+            return
+        menu = QMenu(self)
+        menu.addAction("Validate Looks", self.__on_validate_looks)
+        menu.exec_(self.__ui_looks_list.viewport().mapToGlobal(pos))
+
+    def __on_validate_looks(self):
+        """
+        Check that the textures and files referenced by the looks selected exist and are not empty
+        :return:
+        """
+        if self.__looks_validating is not None:
+            return
+        self.__looks_validating = {item.text(): item.data(Qt.UserRole) for item in self.__ui_looks_list.selectedItems()}
+        # The looks are validated by the workers, the UI stays responsive meanwhile
+        QApplication.setOverrideCursor(Qt.BusyCursor)
+        self.__look_resolver.validate(self.__looks_validating.values())
+
+    def __on_looks_validated(self, validations):
+        """
+        On the validation of the looks selected done by a worker : show the problems found
+        :param validations: {look path: LookValidation or None}, None if the validation failed
+        :return:
+        """
+        look_paths = self.__looks_validating
+        if look_paths is None:
+            return
+        self.__looks_validating = None
+        QApplication.restoreOverrideCursor()
+        if validations is None:
+            validations = {}
+        nb_files = 0
+        errors = []
+        for look_name, look_path in look_paths.items():
+            validation = validations.get(look_path)
+            if validation is None:
+                errors.append("%s : look file can't be read" % look_name)
+                continue
+            nb_files += len(validation.references)
+            errors.extend("%s : missing %s" % (look_name, reference) for reference in validation.missing)
+            errors.extend("%s : empty %s" % (look_name, reference) for reference in validation.empty)
+        msg = QMessageBox(self)
+        msg.setWindowTitle("Validate Looks")
+        if len(errors) > 0:
+            msg.setIcon(QMessageBox.Warning)
+            msg.setText("%d problems found in the files referenced by the looks" % len(errors))
+            msg.setDetailedText("\n".join(errors))
+        else:
+            msg.setIcon(QMessageBox.Information)
+            msg.setText("The %d files referenced by the looks exist" % nb_files)
+        msg.exec_()
+
     def __on_add_looks_to_standin(self):
         """
-        Add selected looks to selected standin
+        Add selected looks to the selected standins in one batch, the looks are found by name in the catalog
+        of each standin
         :return:
         """
         self.__refresh_selection = False
-        self.__standin_obj_selected.add_looks(self.__file_looks_selected, self.__replace_looks)
-        self.__standin_obj_selected.retrieve_looks(self.__current_project_dir)
-        self.__refresh_selection = True
+        look_objs = list(self.__standin_objs_selected)
+        try:
+            for look_obj in look_objs:
+                if not look_obj.is_resolved():
+                    # Resolve right away the standins still pending in the workers
+                    look_obj.apply_resolution(self.__look_factory.resolve(look_obj))
+            look_objs = [look_obj for look_obj in look_objs if look_obj.is_valid()]
+            from .LookBatch import set_looks
+            set_looks(look_objs, self.__look_names_selected, self.__replace_looks,
+                      self.__look_factory.get_scene_adapter())
+        finally:
+            self.__refresh_selection = True
+        self.__refresh_standin_table(look_objs)
+        self.__refresh_looks_list()
+
+    def __on_update_all_standins(self):
+        """
+        Update all the out of date standins listed in one batch
+        :return:
+        """
+        self.__refresh_selection = False
+        look_objs = list(self.__standins.values())
+        try:
+            for look_obj in look_objs:
+                if not look_obj.is_resolved():
+                    # Resolve right away the standins still pending in the workers
+                    look_obj.apply_resolution(self.__look_factory.resolve(look_obj))
+            for look_obj in look_objs:
+                if not look_obj.is_valid():
+                    del self.__standins[look_obj.get_object_name()]
+            look_objs = [look_obj for look_obj in look_objs if look_obj.is_valid()]
+            from .LookBatch import update_standins
+            update_standins(look_objs, self.__look_factory.get_scene_adapter())
+        finally:
+            self.__refresh_selection = True
         self.__refresh_standin_table()
+        self.__refresh_standin_table(look_objs)
         self.__refresh_looks_list()
+
+    def __refresh_instrumentation(self):
+        """
+        Refresh the summary of the instrumentation
+        :return:
+        """
+        self.__ui_instrumentation_txt.setPlainText(instrumentation.format_summary())
+
+    def __on_instrumentation_toggled(self, state):
+        """
+        Show or hide the content of the instrumentation panel
+        :param state
+        :return:
+        """
+        for child in self.__ui_instrumentation_grp.findChildren(QWidget):
+            child.setVisible(state)
+        if state:
+            self.__refresh_instrumentation()
+
+    def __on_reset_instrumentation(self):
+        """
+        Reset the timings and counters
+        :return:
+        """
+        instrumentation.reset()
+        self.__refresh_instrumentation()
+
+    def __on_profile_toggled(self, state):
+        """
+        Start or stop the cProfile capture
+        :param state
+        :return:
+        """
+        if state:
+            instrumentation.start_profiling()
+        else:
+            instrumentation.stop_profiling()
+        self.__refresh_instrumentation()
+
+    def __on_save_instrumentation(self):
+        """
+        Save the summary of the instrumentation as JSON
+        :return:
+        """
+        filepath, _ = QFileDialog.getSaveFileName(self, "Save instrumentation summary", "look_loader_summary.json",
+                                                  "JSON (*.json)")
+        if filepath:
+            instrumentation.dump_summary(filepath)
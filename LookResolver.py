@@ -0,0 +1,153 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from PySide2.QtCore import QObject, Signal
+
+from common.utils import *
+
+from .AssInspector import ass_inspector
+from .TextureValidator import texture_validator
+
+
+class LookResolver(QObject):
+    # Emitted in the main thread with (look_obj, resolution) or (look_obj, None) if the resolution failed
+    resolved = Signal(object, object)
+    # Emitted in the main thread with (path, summary) once a look file is inspected, summary None if it can't be read
+    inspected = Signal(object, object)
+    # Emitted in the main thread with {look path: LookValidation or None} once looks are validated, None if it failed
+    validated = Signal(object)
+
+    def __init__(self, look_factory, max_workers=8, parent=None):
+        """
+        Constructor
+        :param look_factory
+        :param max_workers: number of threads resolving the looks on the filesystem
+        :param parent
+        """
+        super(LookResolver, self).__init__(parent)
+        self.__look_factory = look_factory
+        self.__executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="look_loader")
+        self.__pending = {}
+        self.__inspecting = set()
+
+    def submit(self, look_obj):
+        """
+        Resolve the filesystem part of a LookStandin in a worker thread
+        :param look_obj
+        :return:
+        """
+        if look_obj in self.__pending:
+            return
+        future = self.__executor.submit(self.__look_factory.resolve, look_obj)
+        self.__pending[look_obj] = future
+        # The callback runs in the worker thread, the signal is queued to the main thread
+        future.add_done_callback(lambda f, obj=look_obj: self.__on_done(obj, f))
+
+    def inspect(self, path):
+        """
+        Summarize a look .ass file in a worker thread
+        :param path
+        :return:
+        """
+        if path in self.__inspecting:
+            return
+        self.__inspecting.add(path)
+        future = self.__executor.submit(ass_inspector.inspect, path)
+        future.add_done_callback(lambda f, p=path: self.__on_inspected(p, f))
+
+    def validate(self, look_paths):
+        """
+        Validate the files referenced by looks in a worker thread
+        :param look_paths
+        :return:
+        """
+        future = self.__executor.submit(texture_validator.validate, list(look_paths))
+        future.add_done_callback(self.__on_validated)
+
+    def is_pending(self, look_obj):
+        """
+        Getter of whether a LookStandin is being resolved
+        :param look_obj
+        :return: is pending
+        """
+        return look_obj in self.__pending
+
+    def cancel_all(self):
+        """
+        Cancel the resolutions that haven't started yet
+        :return:
+        """
+        for future in list(self.__pending.values()):
+            future.cancel()
+
+    def shutdown(self):
+        """
+        Stop the worker threads
+        :return:
+        """
+        self.cancel_all()
+        self.__executor.shutdown(wait=False)
+
+    def __on_done(self, look_obj, future):
+        """
+        Emit the result of a resolution
+        :param look_obj
+        :param future
+        :return:
+        """
+        if future.cancelled():
+            self.__pending.pop(look_obj, None)
+            return
+        try:
+            resolution = future.result()
+        except Exception as e:
+            print_warning("Resolution of " + look_obj.get_object_name() + " failed : " + str(e), char_filler='-')
+            resolution = None
+        self.resolved.emit(look_obj, resolution)
+
+    def __on_inspected(self, path, future):
+        """
+        Emit the summary of a look file
+        :param path
+        :param future
+        :return:
+        """
+        if future.cancelled():
+            self.__inspecting.discard(path)
+            return
+        try:
+            summary = future.result()
+        except Exception as e:
+            print_warning("Inspection of " + path + " failed : " + str(e), char_filler='-')
+            summary = None
+        self.inspected.emit(path, summary)
+
+    def __on_validated(self, future):
+        """
+        Emit the validations of looks
+        :param future
+        :return:
+        """
+        if future.cancelled():
+            return
+        try:
+            validations = future.result()
+        except Exception as e:
+            print_warning("Validation of the looks failed : " + str(e), char_filler='-')
+            validations = None
+        self.validated.emit(validations)
+
+    def take_inspection(self, path):
+        """
+        Mark the inspection of a look file as handled in the main thread
+        :param path
+        :return:
+        """
+        self.__inspecting.discard(path)
+
+    def take(self, look_obj):
+        """
+        Mark the resolution of a LookStandin as handled in the main thread
+        :param look_obj
+        :return:
+        """
+        self.__pending.pop(look_obj, None)
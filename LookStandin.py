@@ -1,9 +1,14 @@
 import os
 import re
-import pymel.core as pm
 from abc import ABC, abstractmethod
 from enum import Enum
 from common.utils import *
+from .DirectoryCache import DirectoryCache
+from .PublishScanner import PublishScanner
+from .SceneIndex import IncludeGraphIndex
+from .Instrumentation import instrumentation
+from .LookCatalog import LookCatalog
+from .OperatorChanges import OperatorChanges
 
 
 class LookPresentState(Enum):
@@ -12,33 +17,92 @@ class LookPresentState(Enum):
     AlreadyPlugged = 2
 
 
-class LookStandin(ABC):
-    @staticmethod
-    def __get_free_operator_slot(standin):
+# Plugged state of a look that is not plugged : (state, include graph, versions behind)
+_NOT_PLUGGED = (LookPresentState.NotPlugged, None, 0)
+
+
+class OperatorSlotAllocator:
+    def __init__(self, standin, scene_adapter):
         """
-        Get the first free operator slot of the StandIn
+        Constructor : the connected operators of the StandIn are read once
         :param standin
+        :param scene_adapter
+        """
+        self.__node_by_index = scene_adapter.get_operators(standin)
+        self.__index_by_node = {node: index for index, node in self.__node_by_index.items()}
+        self.__next_free = 0
+
+    def allocate(self):
+        """
+        Get the first free operator slot of the StandIn and mark it as used
         :return: index slot
         """
-        index = 0
-        while True:
-            if pm.getAttr(standin + ".operators[" + str(index) + "]") is None:
-                return index
-            index += 1
+        while self.__next_free in self.__node_by_index:
+            self.__next_free += 1
+        index = self.__next_free
+        self.__next_free += 1
+        return index
+
+    def get_index(self, node):
+        """
+        Getter of the operator slot where a node is plugged
+        :param node
+        :return: index slot or None
+        """
+        return self.__index_by_node.get(node)
+
+
+class LookStandin(ABC):
+    __slots__ = ("_scene_adapter", "__object_name", "_dir_cache", "_include_graph_index", "_valid", "_standin",
+                 "_standin_name", "_catalog", "_plug_states", "_resolved")
 
-    def __init__(self, standin, standin_name, object_name):
+    def __init__(self, standin, standin_name, object_name, dir_cache=None, include_graph_index=None,
+                 scene_adapter=None):
         """
         Constructor
         :param standin
         :param standin_name
         :param object_name
-        """
+        :param dir_cache: DirectoryCache shared between standins
+        :param include_graph_index: IncludeGraphIndex shared between standins
+        :param scene_adapter: SceneAdapter of the standin (the Maya session if None)
+        """
+        if scene_adapter is None:
+            from .ApiSceneAdapter import ApiSceneAdapter
+            scene_adapter = ApiSceneAdapter()
+        self._scene_adapter = scene_adapter
         self.__object_name = object_name
+        self._dir_cache = dir_cache if dir_cache is not None else DirectoryCache()
+        self._include_graph_index = include_graph_index
         self._valid = True
         self._standin = standin
         self._standin_name = standin_name
-        self._looks = {}
-        self._uvs = []
+        # Shared catalog of the asset and plugged state of its looks on this standin {look name: (state, node)}
+        self._catalog = None
+        self._plug_states = {}
+        self._resolved = False
+
+    @property
+    def _looks(self):
+        """
+        Looks of the catalog with their plugged state on this standin
+        :return: {look name: [path, state, node, versions behind]}
+        """
+        if self._catalog is None:
+            return {}
+        looks = {}
+        for look_name, look_path in self._catalog.get_looks():
+            state, node, versions_behind = self._plug_states.get(look_name, _NOT_PLUGGED)
+            looks[look_name] = [look_path, state, node, versions_behind]
+        return looks
+
+    @property
+    def _uvs(self):
+        """
+        UVs of the catalog
+        :return: (version, path) sorted from the latest
+        """
+        return self._catalog.get_uvs() if self._catalog is not None else ()
 
     def get_object_name(self):
         """
@@ -71,6 +135,20 @@ class LookStandin(ABC):
         """
         return self._looks
 
+    def get_catalog(self):
+        """
+        Getter of the shared catalog of the asset
+        :return: catalog or None if not resolved
+        """
+        return self._catalog
+
+    def get_catalog_key(self):
+        """
+        Getter of the key of the catalog shared by the standins of the same asset and kind
+        :return: key
+        """
+        return self._standin_name, type(self).__name__
+
     # Getter of whether the standin object is valid
     def is_valid(self):
         """
@@ -79,93 +157,144 @@ class LookStandin(ABC):
         """
         return self._valid
 
-    def is_looks_up_to_date(self):
+    def is_looks_up_to_date(self, with_versions_behind=False):
         """
         Getter of whether the looks are up to date
-        :return: is looks up to date
+        :param with_versions_behind: whether the number of versions behind is returned too
+        :return: is looks up to date or (is looks up to date, versions behind)
+        """
+        up_to_date = True
+        if self._catalog is not None:
+            for look_name, _ in self._catalog.get_looks():
+                look_state = self._plug_states.get(look_name, _NOT_PLUGGED)[0]
+                if (look_name in ["default", "override"] and look_state == LookPresentState.NotPlugged) or \
+                        look_state == LookPresentState.AnteriorVersionPlugged:
+                    up_to_date = False
+                    break
+        if with_versions_behind:
+            return up_to_date, self.get_versions_behind()
+        return up_to_date
+
+    def get_versions_behind(self):
         """
-        for look_name, look_data in self._looks.items():
-            look_state = look_data[1]
-            if (look_name in ["default", "override"] and look_state == LookPresentState.NotPlugged) or \
-                    look_state == LookPresentState.AnteriorVersionPlugged:
-                return False
-        return True
+        Getter of the number of versions the most out of date plugged look is behind its latest version
+        :return: versions behind
+        """
+        return max((versions_behind for _, _, versions_behind in self._plug_states.values()), default=0)
 
-    def add_looks(self, filepath_looks, replace_looks):
+    def add_looks(self, filepath_looks, replace_looks, operator_changes=None):
         """
         Add Looks to the operators
         :param filepath_looks
+        :param replace_looks: whether the other looks of the standin are unplugged
+        :param operator_changes: OperatorChanges to gather the changes in, applied right away if None
         :return:
         """
-        # print_var(filepath_looks,list(self._looks.items()))
-        # return
-        for look_filepath in filepath_looks:
-            for look_name, look_data in self._looks.items():
-                if look_data[0] == look_filepath:
-                    to_unplug = []
-                    if look_data[1] == LookPresentState.AlreadyPlugged:
-                        # If Replace Mode disconnect all the other looks
-                        if replace_looks:
-                            for ln, ld in self._looks.items():
-                                if ld[2] != look_data[2] :
-                                    # Unplug all the looks except the current (add to a list to unplug)
-                                    to_unplug.append(ld[2])
-                    elif look_data[1] == LookPresentState.AnteriorVersionPlugged:
-                        include_graph = look_data[2]
-                        include_graph.filename.set(look_filepath)
-                    else:
-                        # If Replace Mode replace the first one
-                        if replace_looks and len(self._looks) > 0:
-                            replaced = False
-                            to_unplug = []
-                            for ln, ld in self._looks.items():
-                                if ld[1] == LookPresentState.AlreadyPlugged or ld[1] == LookPresentState.AnteriorVersionPlugged :
-                                    include_graph = ld[2]
-                                    if not replaced:
-                                        # Replace the first
-                                        include_graph.filename.set(look_filepath)
-                                        include_graph.setName("aiIncludeGraph_" +self.__object_name + "_" + look_name)
-                                        replaced = True
-                                    else:
-                                        # Unplug the others looks (add to a list to unplug)
-                                        to_unplug.append(include_graph)
-                        else:
-                            # Create a new look
-                            include_graph = pm.createNode("aiIncludeGraph", n="aiIncludeGraph_" +
-                                                                              self.__object_name + "_" + look_name)
-                            include_graph.filename.set(look_filepath)
-                            include_graph.out >> self._standin.operators[
-                                LookStandin.__get_free_operator_slot(self._standin)]
-                    if replace_looks and len(to_unplug) >0:
-                        # Do Unplug
-                        index = 0
-                        to_unplug_remaining = len(to_unplug)
-                        while to_unplug_remaining>0 or index ==20:
-                            attribute = self.__object_name + ".operators[" + str(index) + "]"
-                            if pm.getAttr(attribute) in to_unplug:
-                                pm.disconnectAttr(attribute)
-                                to_unplug_remaining-=1
-                            index += 1
-                        return # Stop after replacing
-        pm.select(clear=True)
+        with instrumentation.span("add_looks"):
+            self.__apply_changes(self.__reconcile_looks, operator_changes, filepath_looks, replace_looks)
 
-    #
-    def update_existent_looks(self):
+    def update_existent_looks(self, operator_changes=None):
         """
         Update existent Looks to the operators
+        :param operator_changes: OperatorChanges to gather the changes in, applied right away if None
+        :return:
+        """
+        self.__apply_changes(self.__reconcile_existent_looks, operator_changes)
+
+    def __apply_changes(self, reconcile, operator_changes, *args):
+        """
+        Compute the operator changes and apply them if they are not gathered by the caller
+        :param reconcile: function filling the OperatorChanges
+        :param operator_changes
+        :param args: arguments of the function
         :return:
         """
+        self.__invalidate_plugged_looks()
+        if operator_changes is not None:
+            reconcile(operator_changes, *args)
+            return
+        operator_changes = OperatorChanges()
+        reconcile(operator_changes, *args)
+        self._scene_adapter.apply_operator_changes(operator_changes)
+        self._scene_adapter.clear_selection()
+
+    def __get_include_graph_name(self, look_name):
+        """
+        Getter of the name of the include graph of a look
+        :param look_name
+        :return: name
+        """
+        return "aiIncludeGraph_" + self.__object_name + "_" + look_name
+
+    def __reconcile_looks(self, operator_changes, filepath_looks, replace_looks):
+        """
+        Compute the minimal changes to have the looks plugged : the looks already plugged are kept, the anterior
+        versions are retargeted and the others are created. In replace mode the include graphs of the other looks
+        are reused before creating new ones and the remaining ones are unplugged
+        :param operator_changes
+        :param filepath_looks
+        :param replace_looks
+        :return:
+        """
+        looks = self._looks
+        look_by_path = {look_data[0]: (look_name, look_data) for look_name, look_data in looks.items()}
+        requested = []
+        for look_filepath in filepath_looks:
+            look = look_by_path.get(look_filepath)
+            if look is not None and look not in requested:
+                requested.append(look)
+
+        # Include graphs to keep plugged
+        kept = set(look_data[2] for _, look_data in requested if look_data[1] == LookPresentState.AlreadyPlugged)
+        to_plug = []
+        for look_name, look_data in requested:
+            if look_data[1] == LookPresentState.AlreadyPlugged:
+                continue
+            include_graph = look_data[2]
+            if look_data[1] == LookPresentState.AnteriorVersionPlugged and include_graph not in kept:
+                operator_changes.set_filename(include_graph, look_data[0])
+                kept.add(include_graph)
+            else:
+                to_plug.append((look_name, look_data[0]))
+
+        # Include graphs of the other looks, reused or unplugged in replace mode
+        others = []
+        if replace_looks:
+            for look_data in looks.values():
+                if look_data[2] is not None and look_data[2] not in kept and look_data[2] not in others:
+                    others.append(look_data[2])
+
+        slot_allocator = OperatorSlotAllocator(self._standin, self._scene_adapter)
+        for look_name, look_filepath in to_plug:
+            if len(others) > 0:
+                include_graph = others.pop(0)
+                operator_changes.set_filename(include_graph, look_filepath)
+                operator_changes.rename(include_graph, self.__get_include_graph_name(look_name))
+            else:
+                operator_changes.create(self._standin, slot_allocator.allocate(),
+                                        self.__get_include_graph_name(look_name), look_filepath)
+        for include_graph in others:
+            index = slot_allocator.get_index(include_graph)
+            if index is not None:
+                operator_changes.disconnect(self._standin, index)
+
+    def __reconcile_existent_looks(self, operator_changes):
+        """
+        Compute the changes to plug the default and override looks and to retarget the anterior versions
+        :param operator_changes
+        :return:
+        """
+        slot_allocator = None
         for look_name, look_data in self._looks.items():
             look_filepath = look_data[0]
             look_state = look_data[1]
             if look_name in ["default", "override"] and look_state == LookPresentState.NotPlugged:
-                include_graph = pm.createNode("aiIncludeGraph", n="aiIncludeGraph_" + self.__object_name + "_" + look_name)
-                include_graph.filename.set(look_filepath)
-                include_graph.out >> self._standin.operators[LookStandin.__get_free_operator_slot(self._standin)]
+                if slot_allocator is None:
+                    slot_allocator = OperatorSlotAllocator(self._standin, self._scene_adapter)
+                operator_changes.create(self._standin, slot_allocator.allocate(),
+                                        self.__get_include_graph_name(look_name), look_filepath)
             elif look_state == LookPresentState.AnteriorVersionPlugged:
-                include_graph = look_data[2]
-                include_graph.filename.set(look_filepath)
-        pm.select(clear=True)
+                operator_changes.set_filename(look_data[2], look_filepath)
 
     @abstractmethod
     def is_uv_up_to_date(self):
@@ -176,136 +305,189 @@ class LookStandin(ABC):
         pass
 
     @abstractmethod
-    def retrieve_uvs(self, current_project_dir):
+    def _resolve_uvs(self, current_project_dir):
         """
-        Retrieve the UVs
+        Resolve the UVs on the filesystem (safe to call outside the main thread)
         :param current_project_dir
-        :return:
+        :return: uvs or None if the standin is not valid
         """
         pass
 
     @abstractmethod
-    def retrieve_looks(self, current_project_dir):
+    def _resolve_looks(self, current_project_dir):
         """
-        Retrieve the looks
+        Resolve the published looks on the filesystem (safe to call outside the main thread)
         :param current_project_dir
-        :return:
+        :return: looks
         """
         pass
 
-    def _retrieve_looks_aux(self, current_project_dir, folder_sublook, suffix_operator, check_for_override=False):
+    def is_resolved(self):
+        """
+        Getter of whether the looks and the UVs have been resolved
+        :return: is resolved
+        """
+        return self._resolved
+
+    def invalidate_resolution(self):
+        """
+        Mark the looks and the UVs to be resolved again
+        :return:
+        """
+        self._resolved = False
+
+    def resolve(self, current_project_dir):
         """
-        Auxiliary function to retrieve looks
+        Build the catalog of the looks and the UVs of the asset. Nothing is changed on the LookStandin so
+        it can run in a worker thread, the catalog is given to apply_resolution in the main thread
         :param current_project_dir
-        :param folder_sublook
-        :param suffix_operator
-        :param check_for_override
+        :return: catalog
+        """
+        with instrumentation.span("retrieve_looks"):
+            looks = self._resolve_looks(current_project_dir)
+        with instrumentation.span("retrieve_uvs"):
+            uvs = self._resolve_uvs(current_project_dir)
+        return LookCatalog(self._standin_name, type(self).__name__, looks.items(),
+                           uvs if uvs is not None else (), uvs is not None)
+
+    def apply_resolution(self, catalog):
+        """
+        Apply a catalog built by resolve and retrieve the plugged looks (main thread only)
+        :param catalog
         :return:
         """
-        # Looks
-        looks = {}
+        self._catalog = catalog
+        self._valid = catalog.is_valid()
+        self.refresh_plugged_looks()
+        self._resolved = True
 
-        # Looks dir
-        looks_main_dir = os.path.join(current_project_dir, "assets", self._standin_name, "publish")
+    def retrieve_uvs(self, current_project_dir):
+        """
+        Retrieve the UVs (the looks are retrieved as well)
+        :param current_project_dir
+        :return:
+        """
+        self.apply_resolution(self.resolve(current_project_dir))
 
-        # Find default look
-        look_default = ""
-        for f in reversed(os.listdir(looks_main_dir)):
-            filepath = os.path.join(looks_main_dir, f).replace("\\", "/")
-            match = re.match(r"^" + self._standin_name + suffix_operator + r"\.v[0-9]{3}\.ass$", f)
-            if os.path.isfile(filepath) and match:
-                look_default = filepath
-                break
-        # If default is not found then stop the function (valid is False)
-        if look_default is None:
-            self._valid = False
-            return
+    def retrieve_looks(self, current_project_dir):
+        """
+        Retrieve the looks (the UVs are retrieved as well)
+        :param current_project_dir
+        :return:
+        """
+        self.apply_resolution(self.resolve(current_project_dir))
 
-        # Find sublooks within the look folder
-        sublooks_dir = os.path.join(looks_main_dir, folder_sublook)
-        if os.path.isdir(sublooks_dir):
-            for sublook_dir in os.listdir(sublooks_dir):
-                sublook_dir_path = os.path.join(sublooks_dir, sublook_dir).replace("\\", "/")
-                if not os.path.isdir(sublook_dir_path):
-                    continue
-                sublooks = []
-                for sublook in os.listdir(sublook_dir_path):
-                    if re.match(r"^" + self._standin_name + "_" + sublook_dir + suffix_operator + r"\.v[0-9]{3}\.ass$",
-                                sublook):
-                        sublooks.append(sublook)
+    def __get_plugged_looks(self):
+        """
+        Getter of the include graphs plugged on the standin
+        :return: include graph by normalized filename
+        """
+        if self._include_graph_index is None:
+            self._include_graph_index = IncludeGraphIndex(self._scene_adapter)
+        return self._include_graph_index.get_plugged(self._standin)
 
-                if len(sublooks) == 0:
-                    continue
-                sublook_path = os.path.join(sublook_dir_path, sublooks[-1]).replace("\\", "/")
-                looks[sublook_dir] = [sublook_path, LookPresentState.NotPlugged, None]
+    def __invalidate_plugged_looks(self):
+        """
+        Mark the operators of the standin as changed in the include graph index
+        :return:
+        """
+        if self._include_graph_index is not None:
+            self._include_graph_index.invalidate(self._standin)
 
-        looks = dict(sorted(looks.items()))
+    def refresh_plugged_looks(self, include_graph_index=None):
+        """
+        Retrieve the plugged state of the looks again after the operators have been changed (main thread only)
+        :param include_graph_index: IncludeGraphIndex of a new refresh of the scene, the current one if None
+        :return:
+        """
+        if include_graph_index is not None:
+            self._include_graph_index = include_graph_index
+        self._plug_states = {}
+        if self._catalog is not None:
+            self._retrieve_plugged_looks()
+
+    def _resolve_looks_aux(self, current_project_dir, folder_sublook, suffix_operator, check_for_override=False):
+        """
+        Auxiliary function to resolve looks
+        :param current_project_dir
+        :param folder_sublook
+        :param suffix_operator
+        :param check_for_override
+        :return: looks path by look name
+        """
+        looks = {}
+        looks_main_dir = os.path.join(current_project_dir, "assets", self._standin_name, "publish")
+        publish_index = PublishScanner(self._dir_cache).scan_looks(looks_main_dir, self._standin_name, folder_sublook)
 
-        self._looks["default"] = [look_default, LookPresentState.NotPlugged, None]
+        # Default look is the highest version
+        look_default = publish_index.get_latest(suffix_operator)
+        looks["default"] = look_default.path if look_default is not None else ""
 
         if check_for_override:
-            # Find the Override Look
-            for f in os.listdir(looks_main_dir):
-                filepath = os.path.join(looks_main_dir, f).replace("\\", "/")
-                match = re.match(r"^" + self._standin_name + suffix_operator + r"\.ass$", f)
-                if os.path.isfile(filepath) and match:
-                    self._looks["override"] = [filepath, LookPresentState.NotPlugged, None]
-                    break
+            # The Override Look is the unversioned one
+            look_override = publish_index.get_unversioned(suffix_operator)
+            if look_override is not None:
+                looks["override"] = look_override.path
+
+        # Sublooks sorted by name with their highest version
+        for sublook in publish_index.get_sublooks(suffix_operator):
+            looks[sublook] = publish_index.get_latest(suffix_operator, sublook).path
+        return looks
 
-        for look_name, look_data in looks.items():
-            self._looks[look_name] = look_data
-
-        # Determine if the look is used, not used or if a precedent version is used
-        plugged_looks = {include_graph.filename.get().replace("\\", "/"): include_graph
-                         for include_graph in pm.listConnections(self._standin, type="aiIncludeGraph")}
-        suffix_operator_or_override = \
-            suffix_operator if not check_for_override else "(?:_override|" + suffix_operator + ")"
-        for plugged_look_path, plugged_look in plugged_looks.items():
-            match = re.match(r"^(.+" + suffix_operator_or_override + r").+$", plugged_look_path)
-            if not match: continue
-            root_look_path = match.group(1)
-            for look_name in self._looks.keys():
-                if self._looks[look_name][0] == plugged_look_path:
-                    self._looks[look_name][1] = LookPresentState.AlreadyPlugged
-                    self._looks[look_name][2] = plugged_look
-                elif self._looks[look_name][0].startswith(root_look_path) and \
-                        self._looks[look_name][1] != LookPresentState.AlreadyPlugged:
-                    self._looks[look_name][1] = LookPresentState.AnteriorVersionPlugged
-                    self._looks[look_name][2] = plugged_look
+    def _retrieve_plugged_looks(self):
+        """
+        Determine if the looks are used, not used or if another version is used (main thread only).
+        The plugged include graphs are matched by path then by family of versions
+        :return:
+        """
+        plug_states = self._plug_states
+        anterior_looks = []
+        for plugged_look_path, plugged_look in self.__get_plugged_looks().items():
+            look_name = self._catalog.get_look_name(plugged_look_path)
+            if look_name is not None:
+                plug_states[look_name] = (LookPresentState.AlreadyPlugged, plugged_look, 0)
+                continue
+            family = PublishScanner.get_look_family(plugged_look_path)
+            if family is None:
+                continue
+            look_name = self._catalog.get_look_name_by_family(family[0])
+            if look_name is not None:
+                anterior_looks.append((look_name, plugged_look, family[1]))
+        for look_name, plugged_look, plugged_version in anterior_looks:
+            if plug_states.get(look_name, _NOT_PLUGGED)[0] == LookPresentState.AlreadyPlugged:
+                continue
+            version = self._catalog.get_version(look_name)
+            if version == plugged_version:
+                # Same version published in another location of the project
+                plug_states[look_name] = (LookPresentState.AlreadyPlugged, plugged_look, 0)
+                continue
+            versions_behind = max(version - plugged_version, 0) \
+                if version is not None and plugged_version is not None else 0
+            plug_states[look_name] = (LookPresentState.AnteriorVersionPlugged, plugged_look, versions_behind)
 
 
 class LookAsset(LookStandin):
+    __slots__ = ()
+
     @staticmethod
-    def get_uvs(standin_name, current_project_dir):
+    def get_uvs(standin_name, current_project_dir, dir_cache=None):
         """
         Getter of UVs
         :param standin_name
         :param current_project_dir
+        :param dir_cache: DirectoryCache to list the directories
         :return: uvs
         """
-        assets_folder = os.path.join(current_project_dir, "assets")
-        uv_folder = os.path.join(assets_folder, standin_name, "abc")
-        uvs = []
-        if os.path.isdir(uv_folder):
-            for file in os.listdir(uv_folder):
-                file_path = os.path.join(uv_folder, file)
-                print("LOG: %s" % file_path)
-                match = re.match(r".*mod(?:\.v([0-9]{3}))?\.abc", file, re.IGNORECASE)
-                if os.path.isfile(file_path) and match:
-                    try:
-                        uvs.append((int(match.group(1)), file_path))
-                    except:
-                        print("INT MATCH GROUP FAILED")
-            uvs = sorted(uvs, reverse=True)
-        return uvs
+        uv_folder = os.path.join(current_project_dir, "assets", standin_name, "abc")
+        return PublishScanner(dir_cache).scan_uvs(uv_folder)
 
-    def retrieve_looks(self, current_project_dir):
+    def _resolve_looks(self, current_project_dir):
         """
-        Retrieve the looks
+        Resolve the looks
         :param current_project_dir
-        :return:
+        :return: looks
         """
-        self._retrieve_looks_aux(current_project_dir, "look", "_operator", True)
+        return self._resolve_looks_aux(current_project_dir, "look", "_operator", True)
 
     def is_uv_up_to_date(self):
         """
@@ -314,21 +496,22 @@ class LookAsset(LookStandin):
         """
         if len(self._uvs) == 0:
             return True
-        dso = self._standin.dso.get()
+        dso = self._scene_adapter.get_dso(self._standin)
         match = re.match(r".*mod(?:\.v([0-9]{3}))?\.abc", dso, re.IGNORECASE)
         if not match:
             return False
         return int(match.group(1)) == self._uvs[0][0]
 
-    def retrieve_uvs(self, current_project_dir):
+    def _resolve_uvs(self, current_project_dir):
         """
-        Retrieve the UVs
+        Resolve the UVs
         :param current_project_dir
-        :return:
+        :return: uvs or None if no mod file is found
         """
-        self._uvs = LookAsset.get_uvs(self._standin_name, current_project_dir)
-        if len(self._uvs) == 0:
-            self._valid = False
+        uvs = LookAsset.get_uvs(self._standin_name, current_project_dir, self._dir_cache)
+        if len(uvs) == 0:
+            return None
+        return uvs
 
     def update_uvs(self):
         """
@@ -336,18 +519,21 @@ class LookAsset(LookStandin):
         :return:
         """
         if len(self._uvs) == 0:
-            print_warning("No mod files found for " + self.__object_name, char_filler='-')
+            print_warning("No mod files found for " + self.get_object_name(), char_filler='-')
             return
-        self._standin.dso.set(self._uvs[0][1])
+        self._scene_adapter.set_dso(self._standin, self._uvs[0][1])
+
 
 class LookFur(LookStandin):
-    def retrieve_looks(self, current_project_dir):
+    __slots__ = ()
+
+    def _resolve_looks(self, current_project_dir):
         """
-        Retrieve the looks
+        Resolve the looks
         :param current_project_dir
-        :return:
+        :return: looks
         """
-        self._retrieve_looks_aux(current_project_dir, "look_fur", "_fur", False)
+        return self._resolve_looks_aux(current_project_dir, "look_fur", "_fur", False)
 
     def is_uv_up_to_date(self):
         """
@@ -356,6 +542,10 @@ class LookFur(LookStandin):
         """
         return True
 
-    def retrieve_uvs(self, current_project_dir):
-        # Nothing
-        pass
+    def _resolve_uvs(self, current_project_dir):
+        """
+        No UVs with fur
+        :param current_project_dir
+        :return: uvs
+        """
+        return []
@@ -0,0 +1,87 @@
+"""
+Maya plugin registering an undoable command that executes a maya.api.OpenMaya.MDGModifier, so that the
+changes of a modifier are one step of the undo queue. The plugin is loaded on the first commit
+"""
+import sys
+
+import maya.api.OpenMaya as om
+import maya.cmds as cmds
+
+# Tells Maya the plugin uses the Python API 2.0
+maya_useNewAPI = True
+
+_COMMAND_NAME = "lookLoaderCommitModifier"
+
+# Modifiers waiting to be executed by the command
+_pending_modifiers = []
+
+
+class CommitModifierCommand(om.MPxCommand):
+    """
+    Execute the pending modifier of the module given as argument and keep it to undo and redo it
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        super(CommitModifierCommand, self).__init__()
+        self.__modifier = None
+
+    @staticmethod
+    def creator():
+        return CommitModifierCommand()
+
+    @staticmethod
+    def create_syntax():
+        syntax = om.MSyntax()
+        syntax.addArg(om.MSyntax.kString)
+        return syntax
+
+    def doIt(self, args):
+        # The module holding the modifier is not the one loaded as a plugin
+        module_name = om.MArgDatabase(self.syntax(), args).commandArgumentString(0)
+        self.__modifier = sys.modules[module_name].pop_pending_modifier()
+        self.redoIt()
+
+    def redoIt(self):
+        self.__modifier.doIt()
+
+    def undoIt(self):
+        self.__modifier.undoIt()
+
+    def isUndoable(self):
+        return True
+
+
+def initializePlugin(plugin):
+    om.MFnPlugin(plugin).registerCommand(_COMMAND_NAME, CommitModifierCommand.creator,
+                                         CommitModifierCommand.create_syntax)
+
+
+def uninitializePlugin(plugin):
+    om.MFnPlugin(plugin).deregisterCommand(_COMMAND_NAME)
+
+
+def pop_pending_modifier():
+    """
+    Get the oldest modifier waiting to be executed
+    :return: modifier
+    """
+    return _pending_modifiers.pop(0)
+
+
+def commit(modifier):
+    """
+    Execute a modifier as one undoable step
+    :param modifier: MDGModifier
+    :return:
+    """
+    if not cmds.pluginInfo(__file__, query=True, loaded=True):
+        cmds.loadPlugin(__file__, quiet=True)
+    _pending_modifiers.append(modifier)
+    try:
+        getattr(cmds, _COMMAND_NAME)(__name__)
+    finally:
+        if modifier in _pending_modifiers:
+            _pending_modifiers.remove(modifier)
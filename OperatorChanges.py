@@ -0,0 +1,83 @@
+class OperatorChanges:
+    """
+    Changes of the include graphs plugged on standins, gathered to be applied at once by a scene adapter.
+    The creations are connected to their operator slot, the disconnections are applied first
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__creations = []
+        self.__filenames = {}
+        self.__names = {}
+        self.__disconnections = []
+
+    def create(self, standin, index, name, filename):
+        """
+        Create an include graph and plug it in an operator slot of a standin
+        :param standin
+        :param index
+        :param name
+        :param filename
+        :return:
+        """
+        self.__creations.append((standin, index, name, filename))
+
+    def set_filename(self, include_graph, filename):
+        """
+        Set the filename of an include graph
+        :param include_graph
+        :param filename
+        :return:
+        """
+        self.__filenames[include_graph] = filename
+
+    def rename(self, include_graph, name):
+        """
+        Rename an include graph
+        :param include_graph
+        :param name
+        :return:
+        """
+        self.__names[include_graph] = name
+
+    def disconnect(self, standin, index):
+        """
+        Unplug an operator slot of a standin
+        :param standin
+        :param index
+        :return:
+        """
+        self.__disconnections.append((standin, index))
+
+    def get_creations(self):
+        """
+        Getter of the include graphs to create
+        :return: [(standin, index, name, filename)]
+        """
+        return self.__creations
+
+    def get_filenames(self):
+        """
+        Getter of the filenames to set
+        :return: {include_graph: filename}
+        """
+        return self.__filenames
+
+    def get_names(self):
+        """
+        Getter of the names to set
+        :return: {include_graph: name}
+        """
+        return self.__names
+
+    def get_disconnections(self):
+        """
+        Getter of the operator slots to unplug
+        :return: [(standin, index)]
+        """
+        return self.__disconnections
+
+    def __len__(self):
+        return len(self.__creations) + len(self.__filenames) + len(self.__names) + len(self.__disconnections)
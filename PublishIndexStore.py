@@ -0,0 +1,153 @@
+import json
+import os
+import time
+import uuid
+import zlib
+
+from .Instrumentation import logger
+
+_FORMAT_VERSION = 1
+
+# Time in s waited for the lock of the index before giving up the save
+_LOCK_TIMEOUT = 10.0
+# Age in s of a lock left by a session that died while saving
+_LOCK_STALE_AGE = 60.0
+
+# Flags of an entry
+_FLAG_FILE = 1
+_FLAG_DIR = 2
+
+
+class PublishIndexStore:
+    """
+    Persistent index of the directory listings of a project, shared across sessions and artists.
+    The file is a zlib compressed JSON rewritten atomically (temporary file + rename) and merged
+    with the listings written by the other sessions in the meantime, under a lock file so that
+    concurrent saves don't lose each other's listings
+    """
+
+    def __init__(self, filepath):
+        """
+        Constructor
+        :param filepath
+        """
+        self.__filepath = filepath
+
+    @staticmethod
+    def get_default_filepath(current_project_dir):
+        """
+        Getter of the default index file of a project
+        :param current_project_dir
+        :return: filepath
+        """
+        return os.path.join(current_project_dir, "assets", ".look_loader_index").replace("\\", "/")
+
+    def get_filepath(self):
+        """
+        Getter of the index file
+        :return: filepath
+        """
+        return self.__filepath
+
+    def __read(self):
+        """
+        Read the index file
+        :return: {directory: [mtime, [[name, flags]]]}
+        """
+        try:
+            with open(self.__filepath, "rb") as index_file:
+                data = json.loads(zlib.decompress(index_file.read()).decode("utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, zlib.error) as e:
+            logger.warning("Publish index %s could not be read : %s", self.__filepath, e)
+            return {}
+        if data.get("version") != _FORMAT_VERSION:
+            return {}
+        return data.get("dirs", {})
+
+    def load(self):
+        """
+        Load the directory listings
+        :return: {directory: (mtime, [(name, is_file, is_dir)])}
+        """
+        return {directory: (mtime, [(name, bool(flags & _FLAG_FILE), bool(flags & _FLAG_DIR))
+                                    for name, flags in entries])
+                for directory, (mtime, entries) in self.__read().items()}
+
+    def __acquire_lock(self):
+        """
+        Create the lock file of the index, a lock older than _LOCK_STALE_AGE is considered left by a dead session
+        :return: lock filepath or None if the lock could not be acquired
+        """
+        lock_filepath = self.__filepath + ".lock"
+        deadline = time.monotonic() + _LOCK_TIMEOUT
+        while True:
+            try:
+                os.close(os.open(lock_filepath, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return lock_filepath
+            except FileExistsError:
+                try:
+                    if time.time() - os.stat(lock_filepath).st_mtime > _LOCK_STALE_AGE:
+                        os.remove(lock_filepath)
+                        continue
+                except OSError:
+                    continue
+            except OSError as e:
+                logger.warning("Publish index %s could not be locked : %s", self.__filepath, e)
+                return None
+            if time.monotonic() > deadline:
+                logger.warning("Publish index %s is locked by another session", self.__filepath)
+                return None
+            time.sleep(0.1)
+
+    def save(self, listings):
+        """
+        Merge directory listings in the index file and write it atomically
+        :param listings: {directory: (mtime, [(name, is_file, is_dir)])}
+        :return: whether the index has been written
+        """
+        if len(listings) == 0:
+            return True
+        lock_filepath = self.__acquire_lock()
+        if lock_filepath is None:
+            return False
+        try:
+            return self.__merge(listings)
+        finally:
+            try:
+                os.remove(lock_filepath)
+            except OSError:
+                pass
+
+    def __merge(self, listings):
+        """
+        Merge directory listings in the index file and write it atomically (under the lock)
+        :param listings: {directory: (mtime, [(name, is_file, is_dir)])}
+        :return: whether the index has been written
+        """
+        dirs = self.__read()
+        for directory, (mtime, entries) in listings.items():
+            stored = dirs.get(directory)
+            if stored is not None and stored[0] is not None and mtime is not None and stored[0] > mtime:
+                # Another session has seen a more recent version of the directory
+                continue
+            dirs[directory] = [mtime, [[name, (_FLAG_FILE if is_file else 0) | (_FLAG_DIR if is_dir else 0)]
+                                       for name, is_file, is_dir in entries]]
+        data = zlib.compress(json.dumps({"version": _FORMAT_VERSION, "dirs": dirs},
+                                        separators=(",", ":")).encode("utf-8"))
+        tmp_filepath = self.__filepath + "." + uuid.uuid4().hex
+        try:
+            # The permissions of the index shared between the artists are the ones of the umask
+            fd = os.open(tmp_filepath, os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0), 0o666)
+            try:
+                with os.fdopen(fd, "wb") as tmp_file:
+                    tmp_file.write(data)
+                os.replace(tmp_filepath, self.__filepath)
+            except BaseException:
+                os.remove(tmp_filepath)
+                raise
+        except OSError as e:
+            logger.warning("Publish index %s could not be written : %s", self.__filepath, e)
+            return False
+        return True
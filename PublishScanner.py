@@ -0,0 +1,149 @@
+import os
+import re
+from collections import namedtuple
+
+from .DirectoryCache import DirectoryCache
+from .Instrumentation import logger
+
+# Published look : <asset>[_<sublook>]<suffix>[.vNNN].ass
+_LOOK_FILE_PATTERN = re.compile(r"^(?P<base>.+?)(?P<suffix>_operator|_fur)(?:\.v(?P<version>[0-9]{3}))?\.ass$")
+# UV mod : <...>mod[.vNNN].abc
+_UV_FILE_PATTERN = re.compile(r"^.*mod(?:\.v(?P<version>[0-9]{3}))?\.abc$", re.IGNORECASE)
+
+# A published file. version is None for an unversioned file (override look, unversioned mod)
+PublishRecord = namedtuple("PublishRecord", ["asset", "sublook", "suffix", "version", "path"])
+
+
+class PublishIndex:
+    def __init__(self, records):
+        """
+        Constructor
+        :param records: PublishRecord of an asset
+        """
+        self.__latest = {}
+        self.__unversioned = {}
+        for record in records:
+            key = (record.sublook, record.suffix)
+            if record.version is None:
+                self.__unversioned[key] = record
+                continue
+            current = self.__latest.get(key)
+            if current is None or record.version > current.version:
+                self.__latest[key] = record
+
+    def get_latest(self, suffix, sublook=None):
+        """
+        Getter of the latest version of a look
+        :param suffix
+        :param sublook: None for the default look
+        :return: PublishRecord or None
+        """
+        return self.__latest.get((sublook, suffix))
+
+    def get_unversioned(self, suffix, sublook=None):
+        """
+        Getter of the unversioned file of a look (the override look)
+        :param suffix
+        :param sublook: None for the default look
+        :return: PublishRecord or None
+        """
+        return self.__unversioned.get((sublook, suffix))
+
+    def get_sublooks(self, suffix):
+        """
+        Getter of the sorted names of the sublooks having a version
+        :param suffix
+        :return: sublook names
+        """
+        return sorted(sublook for sublook, sfx in self.__latest.keys() if sublook is not None and sfx == suffix)
+
+
+class PublishScanner:
+    def __init__(self, dir_cache=None):
+        """
+        Constructor
+        :param dir_cache: DirectoryCache to list the directories
+        """
+        self.__dir_cache = dir_cache if dir_cache is not None else DirectoryCache()
+
+    @staticmethod
+    def parse_look_filename(filename):
+        """
+        Parse the filename of a published look
+        :param filename
+        :return: (base, suffix, version) or None
+        """
+        match = _LOOK_FILE_PATTERN.match(filename)
+        if match is None:
+            return None
+        version = match.group("version")
+        return match.group("base"), match.group("suffix"), int(version) if version is not None else None
+
+    @staticmethod
+    def get_look_family(path):
+        """
+        Getter of the family of a look file : the versions of a look share the same family
+        :param path
+        :return: ((base, suffix, unversioned), version) or None if not a look file
+        """
+        parsed = PublishScanner.parse_look_filename(os.path.basename(path.replace("\\", "/")))
+        if parsed is None:
+            return None
+        base, suffix, version = parsed
+        return (base, suffix, version is None), version
+
+    def __scan_look_dir(self, directory, asset, sublook, records):
+        """
+        Scan the looks files of a directory in one pass
+        :param directory
+        :param asset
+        :param sublook: None for the publish directory
+        :param records: list filled with the PublishRecords
+        :return: entries of the directory
+        """
+        expected_base = asset if sublook is None else asset + "_" + sublook
+        entries = self.__dir_cache.listdir(directory)
+        for entry in entries:
+            if not entry.is_file:
+                continue
+            parsed = PublishScanner.parse_look_filename(entry.name)
+            if parsed is None or parsed[0] != expected_base:
+                continue
+            records.append(PublishRecord(asset, sublook, parsed[1], parsed[2], entry.path))
+        return entries
+
+    def scan_looks(self, publish_dir, asset, folder_sublook):
+        """
+        Scan the publish directory of an asset and its sublooks folder
+        :param publish_dir
+        :param asset
+        :param folder_sublook: folder of the sublooks within the publish directory
+        :return: PublishIndex
+        """
+        records = []
+        entries = self.__scan_look_dir(publish_dir, asset, None, records)
+        if any(entry.is_dir and entry.name == folder_sublook for entry in entries):
+            for sublook_entry in self.__dir_cache.listdir(os.path.join(publish_dir, folder_sublook)):
+                if sublook_entry.is_dir:
+                    self.__scan_look_dir(sublook_entry.path, asset, sublook_entry.name, records)
+        return PublishIndex(records)
+
+    def scan_uvs(self, abc_dir):
+        """
+        Scan the versioned UV mod files of a directory
+        :param abc_dir
+        :return: (version, path) sorted from the latest
+        """
+        uvs = []
+        for entry in self.__dir_cache.listdir(abc_dir):
+            logger.debug("UV file : %s", entry.path)
+            if not entry.is_file:
+                continue
+            match = _UV_FILE_PATTERN.match(entry.name)
+            if match is None:
+                continue
+            if match.group("version") is None:
+                logger.debug("UV file without version : %s", entry.path)
+                continue
+            uvs.append((int(match.group("version")), entry.path))
+        return sorted(uvs, reverse=True)
@@ -0,0 +1,251 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from PySide2.QtCore import QObject, QFileSystemWatcher, QTimer, Signal
+
+from .Instrumentation import logger
+
+# Folders of an asset where the looks and the UVs are published
+_PUBLISH_FOLDERS = ["publish", "publish/look", "publish/look_fur", "abc"]
+# Folders whose subfolders are watched as well (sublooks)
+_SUBLOOK_FOLDERS = ["publish/look", "publish/look_fur"]
+
+
+class PublishWatcher(QObject):
+    """
+    Watch the publish directories of the assets in use. Notifications of the filesystem are used
+    where available, the mtimes are also polled in a worker thread for the network shares that don't notify
+    """
+
+    # Emitted in the main thread with the set of the asset names whose publish directories changed
+    assets_changed = Signal(object)
+    # Internal : emitted by the poll thread with the directories whose mtime changed
+    __dirs_polled = Signal(object)
+    # Internal : emitted by the poll thread with the directories of the assets added {directory: (asset, mtime)}
+    __dirs_listed = Signal(object)
+
+    def __init__(self, current_project_dir, poll_interval=5000, parent=None):
+        """
+        Constructor
+        :param current_project_dir
+        :param poll_interval: interval in ms of the mtime polling, 0 to disable it
+        :param parent
+        """
+        super(PublishWatcher, self).__init__(parent)
+        self.__current_project_dir = current_project_dir
+        self.__poll_interval = poll_interval
+        # Assets to watch, their directories are watched once listed by the poll thread
+        self.__assets = set()
+        self.__asset_by_dir = {}
+        self.__mtimes = {}
+        self.__lock = threading.Lock()
+        self.__poll_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="look_loader_watcher")
+        self.__polling = False
+
+        self.__fs_watcher = QFileSystemWatcher(self)
+        self.__fs_watcher.directoryChanged.connect(self.__on_directory_changed)
+        self.__dirs_polled.connect(self.__on_dirs_polled)
+        self.__dirs_listed.connect(self.__on_dirs_listed)
+
+        self.__poll_timer = QTimer(self)
+        self.__poll_timer.timeout.connect(self.__poll)
+        if poll_interval > 0:
+            self.__poll_timer.start(poll_interval)
+
+    @staticmethod
+    def __get_mtime(path):
+        """
+        Get the mtime of a directory
+        :param path
+        :return: mtime or None
+        """
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    def __get_asset_dirs(self, asset):
+        """
+        Getter of the directories of an asset to watch
+        :param asset
+        :return: directories
+        """
+        asset_dir = os.path.join(self.__current_project_dir, "assets", asset).replace("\\", "/")
+        dirs = [asset_dir + "/" + folder for folder in _PUBLISH_FOLDERS]
+        for folder in _SUBLOOK_FOLDERS:
+            sublooks_dir = asset_dir + "/" + folder
+            try:
+                with os.scandir(sublooks_dir) as it:
+                    dirs.extend(entry.path.replace("\\", "/") for entry in it if entry.is_dir())
+            except OSError:
+                continue
+        return dirs
+
+    def set_assets(self, assets):
+        """
+        Set the assets to watch. The directories of the assets added are listed by the poll thread
+        :param assets: asset names
+        :return:
+        """
+        assets = set(assets)
+        if assets == self.__assets:
+            return
+        removed_assets = self.__assets - assets
+        added_assets = assets - self.__assets
+        self.__assets = assets
+        if len(removed_assets) > 0:
+            with self.__lock:
+                removed = [d for d, asset in self.__asset_by_dir.items() if asset in removed_assets]
+                for directory in removed:
+                    del self.__asset_by_dir[directory]
+                    self.__mtimes.pop(directory, None)
+            watched = set(self.__fs_watcher.directories())
+            removed = [d for d in removed if d in watched]
+            if len(removed) > 0:
+                self.__fs_watcher.removePaths(removed)
+        if len(added_assets) > 0:
+            self.__poll_executor.submit(self.__list_job, sorted(added_assets))
+
+    def rescan(self, assets):
+        """
+        List again the directories of assets in the poll thread, whatever the assets watched, so that the sublook
+        folders published since they were added are watched too
+        :param assets: asset names
+        :return:
+        """
+        assets = sorted(set(assets) & self.__assets)
+        if len(assets) > 0:
+            self.__poll_executor.submit(self.__list_job, assets)
+
+    def __list_job(self, assets):
+        """
+        Job of the poll thread listing the directories of assets and their mtime
+        :param assets
+        :return:
+        """
+        try:
+            listed = {}
+            for asset in assets:
+                for directory in self.__get_asset_dirs(asset):
+                    listed[directory] = (asset, PublishWatcher.__get_mtime(directory))
+            self.__dirs_listed.emit(listed)
+        except Exception as e:
+            logger.warning("Listing of the publish directories failed : %s", e)
+
+    def __on_dirs_listed(self, listed):
+        """
+        On the directories of assets listed : watch the ones of the assets still in use not watched yet
+        :param listed: {directory: (asset, mtime)}
+        :return:
+        """
+        added = []
+        with self.__lock:
+            for directory, (asset, mtime) in listed.items():
+                if asset not in self.__assets or directory in self.__asset_by_dir:
+                    continue
+                self.__asset_by_dir[directory] = asset
+                self.__mtimes[directory] = mtime
+                if mtime is not None:
+                    added.append(directory)
+        if len(added) > 0:
+            self.__fs_watcher.addPaths(added)
+
+    def get_dirs(self, asset):
+        """
+        Getter of the watched directories of an asset
+        :param asset
+        :return: directories
+        """
+        with self.__lock:
+            return [directory for directory, a in self.__asset_by_dir.items() if a == asset]
+
+    def pause(self):
+        """
+        Pause the polling, the notifications of the filesystem are still handled
+        :return:
+        """
+        self.__poll_timer.stop()
+
+    def resume(self):
+        """
+        Resume the polling and poll right away the changes missed while paused
+        :return:
+        """
+        if self.__poll_interval > 0 and not self.__poll_timer.isActive():
+            self.__poll_timer.start(self.__poll_interval)
+            self.__poll()
+
+    def stop(self):
+        """
+        Stop watching
+        :return:
+        """
+        self.__poll_timer.stop()
+        self.__poll_executor.shutdown(wait=False)
+        watched = self.__fs_watcher.directories()
+        if len(watched) > 0:
+            self.__fs_watcher.removePaths(watched)
+
+    def __poll(self):
+        """
+        Poll the mtimes of the watched directories in the worker thread
+        :return:
+        """
+        if self.__polling:
+            return
+        self.__polling = True
+        self.__poll_executor.submit(self.__poll_job)
+
+    def __poll_job(self):
+        """
+        Job of the poll thread
+        :return:
+        """
+        try:
+            with self.__lock:
+                mtimes = dict(self.__mtimes)
+            changed = [directory for directory, mtime in mtimes.items()
+                       if PublishWatcher.__get_mtime(directory) != mtime]
+            self.__dirs_polled.emit(changed)
+        except Exception as e:
+            logger.warning("Polling of the publish directories failed : %s", e)
+            self.__dirs_polled.emit([])
+
+    def __on_dirs_polled(self, dirs):
+        """
+        On the poll done
+        :param dirs: directories changed
+        :return:
+        """
+        self.__polling = False
+        self.__notify(dirs)
+
+    def __on_directory_changed(self, directory):
+        """
+        On a directory changed notified by the filesystem
+        :param directory
+        :return:
+        """
+        self.__notify([directory.replace("\\", "/")])
+
+    def __notify(self, dirs):
+        """
+        Emit the assets whose directories changed
+        :param dirs
+        :return:
+        """
+        assets = set()
+        with self.__lock:
+            for directory in dirs:
+                asset = self.__asset_by_dir.get(directory)
+                if asset is None:
+                    continue
+                mtime = PublishWatcher.__get_mtime(directory)
+                if mtime == self.__mtimes.get(directory):
+                    continue
+                self.__mtimes[directory] = mtime
+                assets.add(asset)
+        if len(assets) > 0:
+            logger.debug("Publish changed for %s", ", ".join(sorted(assets)))
+            self.assets_changed.emit(assets)
@@ -0,0 +1,246 @@
+from abc import ABC, abstractmethod
+
+
+class SceneAdapter(ABC):
+    """
+    Access to the scene needed by the looks resolution. Standins and include graphs are opaque handles
+    that are only given back to the adapter
+    """
+
+    def refresh(self):
+        """
+        Forget what has been read of the scene, it may have been changed since
+        :return:
+        """
+        pass
+
+    @abstractmethod
+    def list_standins(self):
+        """
+        List all the standins of the scene
+        :return: standins
+        """
+        pass
+
+    def list_selected_standins(self):
+        """
+        List the standins within the selection of the scene, each standin once
+        :return: standins or None if nothing is selected
+        """
+        return None
+
+    @abstractmethod
+    def get_object_name(self, standin):
+        """
+        Getter of the name of the transform of a standin
+        :param standin
+        :return: object name
+        """
+        pass
+
+    @abstractmethod
+    def get_dso(self, standin):
+        """
+        Getter of the file loaded by a standin
+        :param standin
+        :return: dso or None
+        """
+        pass
+
+    @abstractmethod
+    def set_dso(self, standin, dso):
+        """
+        Setter of the file loaded by a standin
+        :param standin
+        :param dso
+        :return:
+        """
+        pass
+
+    @abstractmethod
+    def get_plugged_include_graphs(self, standins=None):
+        """
+        Getter of the include graphs plugged on standins
+        :param standins: None for all the standins of the scene
+        :return: {standin: {filename: include_graph}}
+        """
+        pass
+
+    @abstractmethod
+    def get_operators(self, standin):
+        """
+        Getter of the operators plugged on a standin
+        :param standin
+        :return: {index: include_graph}
+        """
+        pass
+
+    @abstractmethod
+    def create_include_graph(self, name, filename):
+        """
+        Create an include graph
+        :param name
+        :param filename
+        :return: include graph
+        """
+        pass
+
+    @abstractmethod
+    def set_include_graph_filename(self, include_graph, filename):
+        """
+        Setter of the filename of an include graph
+        :param include_graph
+        :param filename
+        :return:
+        """
+        pass
+
+    @abstractmethod
+    def rename_include_graph(self, include_graph, name):
+        """
+        Rename an include graph
+        :param include_graph
+        :param name
+        :return:
+        """
+        pass
+
+    @abstractmethod
+    def connect_operator(self, include_graph, standin, index):
+        """
+        Plug an include graph in an operator slot of a standin
+        :param include_graph
+        :param standin
+        :param index
+        :return:
+        """
+        pass
+
+    @abstractmethod
+    def disconnect_operator(self, standin, index):
+        """
+        Unplug an operator slot of a standin
+        :param standin
+        :param index
+        :return:
+        """
+        pass
+
+    def apply_operator_changes(self, operator_changes):
+        """
+        Apply operator changes : the slots are unplugged first, then the include graphs are retargeted,
+        renamed, created and plugged
+        :param operator_changes: OperatorChanges
+        :return: include graphs created
+        """
+        for standin, index in operator_changes.get_disconnections():
+            self.disconnect_operator(standin, index)
+        for include_graph, filename in operator_changes.get_filenames().items():
+            self.set_include_graph_filename(include_graph, filename)
+        for include_graph, name in operator_changes.get_names().items():
+            self.rename_include_graph(include_graph, name)
+        include_graphs = []
+        for standin, index, name, filename in operator_changes.get_creations():
+            include_graph = self.create_include_graph(name, filename)
+            self.connect_operator(include_graph, standin, index)
+            include_graphs.append(include_graph)
+        return include_graphs
+
+    def clear_selection(self):
+        """
+        Clear the selection of the scene
+        :return:
+        """
+        pass
+
+
+class MemorySceneAdapter(SceneAdapter):
+    """
+    Scene held in memory : standins are identified by their index in the order they are added, so that standins
+    sharing an object name are kept apart, and include graphs by their name
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__object_names = []
+        self.__dsos = {}
+        self.__operators = {}
+        self.__include_graph_filenames = {}
+        self.__selection = []
+
+    def add_standin(self, object_name, dso, plugged_filenames=()):
+        """
+        Add a standin to the scene
+        :param object_name: name displayed, several standins may have the same
+        :param dso
+        :param plugged_filenames: filenames of the include graphs plugged on the standin
+        :return: standin
+        """
+        standin = len(self.__object_names)
+        self.__object_names.append(object_name)
+        self.__dsos[standin] = dso
+        self.__operators[standin] = {}
+        for index, filename in enumerate(plugged_filenames):
+            include_graph = self.create_include_graph("aiIncludeGraph_" + object_name + "_" + str(index), filename)
+            self.connect_operator(include_graph, standin, index)
+        return standin
+
+    def list_standins(self):
+        return list(self.__dsos.keys())
+
+    def select(self, standins):
+        """
+        Select standins of the scene
+        :param standins
+        :return:
+        """
+        self.__selection = list(dict.fromkeys(standins))
+
+    def list_selected_standins(self):
+        return list(self.__selection) if len(self.__selection) > 0 else None
+
+    def get_object_name(self, standin):
+        return self.__object_names[standin]
+
+    def get_dso(self, standin):
+        return self.__dsos.get(standin)
+
+    def set_dso(self, standin, dso):
+        self.__dsos[standin] = dso
+
+    def get_plugged_include_graphs(self, standins=None):
+        if standins is None:
+            standins = self.__operators.keys()
+        return {standin: {self.__include_graph_filenames[include_graph]: include_graph
+                          for include_graph in self.__operators.get(standin, {}).values()}
+                for standin in standins}
+
+    def get_operators(self, standin):
+        return dict(self.__operators.get(standin, {}))
+
+    def create_include_graph(self, name, filename):
+        unique_name = name
+        suffix = 1
+        while unique_name in self.__include_graph_filenames:
+            unique_name = name + str(suffix)
+            suffix += 1
+        self.__include_graph_filenames[unique_name] = filename.replace("\\", "/")
+        return unique_name
+
+    def set_include_graph_filename(self, include_graph, filename):
+        self.__include_graph_filenames[include_graph] = filename.replace("\\", "/")
+
+    def rename_include_graph(self, include_graph, name):
+        # Include graphs are identified by their name in memory, renaming has no effect
+        pass
+
+    def connect_operator(self, include_graph, standin, index):
+        self.__operators.setdefault(standin, {})[index] = include_graph
+
+    def disconnect_operator(self, standin, index):
+        self.__operators.get(standin, {}).pop(index, None)
+
+    def clear_selection(self):
+        self.__selection = []
@@ -0,0 +1,29 @@
+class IncludeGraphIndex:
+    def __init__(self, scene_adapter):
+        """
+        Constructor. Index of the aiIncludeGraph plugged on the aiStandIns generated, each standin is queried
+        on its first access so that only the standins in use are read from the scene
+        :param scene_adapter
+        """
+        self.__scene_adapter = scene_adapter
+        self.__plugged_by_standin = {}
+
+    def get_plugged(self, standin):
+        """
+        Getter of the include graphs plugged on a standin
+        :param standin
+        :return: include graph by normalized filename
+        """
+        plugged = self.__plugged_by_standin.get(standin)
+        if plugged is None:
+            plugged = self.__scene_adapter.get_plugged_include_graphs([standin]).get(standin, {})
+            self.__plugged_by_standin[standin] = plugged
+        return plugged
+
+    def invalidate(self, standin):
+        """
+        Mark the operators of a standin as changed, they will be queried again on next access
+        :param standin
+        :return:
+        """
+        self.__plugged_by_standin.pop(standin, None)
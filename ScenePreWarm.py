@@ -0,0 +1,157 @@
+"""
+Opt-in pre-warm of the looks of the standins when a scene is opened : the catalogs of the assets are resolved
+in background workers while the artist is still looking at the scene, the LookLoader then picks them up.
+
+Enabled in userSetup.py with :
+    from look_loader import ScenePreWarm
+    ScenePreWarm.enable()
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import maya.api.OpenMaya as om
+import maya.utils
+
+from .LookFactory import LookFactory
+from .Instrumentation import instrumentation, logger
+
+_MAX_WORKERS = 4
+
+# LookFactory shared by the pre-warm and the LookLoader by project directory
+_look_factories = {}
+# Pre-warm waiting to be picked up
+_current_warm = None
+_executor = None
+_callback_id = None
+
+
+class _Warm:
+    def __init__(self, current_project_dir, standins_by_shape):
+        """
+        Constructor. LookStandins generated by a pre-warm
+        :param current_project_dir
+        :param standins_by_shape: {standin: LookStandin or None}
+        """
+        self.current_project_dir = current_project_dir
+        self.standins_by_shape = standins_by_shape
+
+
+def get_look_factory(current_project_dir):
+    """
+    Getter of the LookFactory of a project shared in the session
+    :param current_project_dir
+    :return: look factory
+    """
+    look_factory = _look_factories.get(current_project_dir)
+    if look_factory is None:
+        look_factory = LookFactory(current_project_dir)
+        _look_factories[current_project_dir] = look_factory
+    return look_factory
+
+
+def take_standins(current_project_dir):
+    """
+    Take the LookStandins of the last pre-warm, the resolutions still pending are left to the caller
+    :param current_project_dir
+    :return: {standin: LookStandin or None}
+    """
+    global _current_warm
+    warm = _current_warm
+    _current_warm = None
+    if warm is None or warm.current_project_dir != current_project_dir:
+        return {}
+    return {standin: look_obj if look_obj is None or not look_obj.is_resolved() or look_obj.is_valid() else None
+            for standin, look_obj in warm.standins_by_shape.items()}
+
+
+def prewarm(current_project_dir=None):
+    """
+    Generate the LookStandins of the scene and resolve their catalogs in the background (main thread only)
+    :param current_project_dir: CURRENT_PROJECT_DIR if None
+    :return:
+    """
+    global _current_warm, _executor
+    if current_project_dir is None:
+        current_project_dir = os.getenv("CURRENT_PROJECT_DIR")
+    if current_project_dir is None:
+        return
+    with instrumentation.span("ScenePreWarm.prewarm"):
+        look_factory = get_look_factory(current_project_dir)
+        look_factory.refresh()
+        standins_by_shape = {}
+        look_objs_by_catalog = {}
+        for standin in look_factory.get_scene_adapter().list_standins():
+            look_obj = look_factory.generate(standin, resolve=False)
+            standins_by_shape[standin] = look_obj
+            if look_obj is not None:
+                look_objs_by_catalog.setdefault(look_obj.get_catalog_key(), []).append(look_obj)
+        warm = _Warm(current_project_dir, standins_by_shape)
+        _current_warm = warm
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_MAX_WORKERS, thread_name_prefix="look_loader_prewarm")
+        # One resolution per catalog, shared by all the standins of the asset
+        for look_objs in look_objs_by_catalog.values():
+            future = _executor.submit(look_factory.resolve, look_objs[0])
+            future.add_done_callback(
+                lambda f, objs=look_objs: maya.utils.executeDeferred(partial(_apply, warm, objs, f)))
+    logger.debug("Pre-warm of %d standins and %d catalogs", len(standins_by_shape), len(look_objs_by_catalog))
+
+
+def _apply(warm, look_objs, future):
+    """
+    Apply a catalog resolved by a worker (main thread)
+    :param warm
+    :param look_objs: LookStandins of the catalog
+    :param future
+    :return:
+    """
+    if warm is not _current_warm:
+        # Picked up or replaced in the meantime
+        return
+    try:
+        catalog = future.result()
+    except Exception as e:
+        logger.warning("Pre-warm of %s failed : %s", look_objs[0].get_standin_name(), e)
+        return
+    for look_obj in look_objs:
+        if not look_obj.is_resolved():
+            look_obj.apply_resolution(catalog)
+
+
+def _on_after_open(*args):
+    """
+    On a scene opened : the pre-warm is run once Maya is idle
+    :param args
+    :return:
+    """
+    maya.utils.executeDeferred(prewarm)
+
+
+def enable():
+    """
+    Pre-warm the looks each time a scene is opened
+    :return:
+    """
+    global _callback_id
+    if _callback_id is None:
+        _callback_id = om.MSceneMessage.addCallback(om.MSceneMessage.kAfterOpen, _on_after_open)
+
+
+def disable():
+    """
+    Stop pre-warming the looks when a scene is opened
+    :return:
+    """
+    global _callback_id
+    if _callback_id is not None:
+        om.MMessage.removeCallback(_callback_id)
+        _callback_id = None
+
+
+def is_enabled():
+    """
+    Getter of whether the looks are pre-warmed when a scene is opened
+    :return: is enabled
+    """
+    return _callback_id is not None
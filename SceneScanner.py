@@ -0,0 +1,343 @@
+"""
+Report the look and UV status of the standins of Maya ASCII scenes without opening them in Maya
+
+Usage : python -m look_loader.SceneScanner scenes... [-p PROJECT_DIR] [-o report.csv|report.json] [-j PROCESSES]
+
+The scenes are read as a stream : only the aiStandIn dso, the aiIncludeGraph filenames and the operator
+connections are kept. Referenced scenes are not followed. The scenes that can't be read and the standins without
+dso are reported with an error
+"""
+import argparse
+import csv
+import json
+import os
+import re
+import shlex
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from .HeadlessResolver import resolve_records
+
+_STANDIN_TYPE = "aiStandIn"
+_INCLUDE_GRAPH_TYPE = "aiIncludeGraph"
+# Commands of the statements read, the others are skipped without being parsed. rename is not one of them : the
+# "rename -uid" written after each createNode keeps the node the setAttr apply to
+_COMMANDS = ("createNode", "setAttr", "connectAttr", "select")
+
+_STATEMENT_START_PATTERN = re.compile(r"^\t?(\w+)")
+_OPERATOR_PLUG_PATTERN = re.compile(r"^(.+)\.operators\[([0-9]+)\]$")
+_OUT_PLUG_PATTERN = re.compile(r"^(.+)\.out$")
+
+_REPORT_FIELDS = ["scene", "object", "standin_name", "kind", "looks_up_to_date", "versions_behind", "uv_up_to_date",
+                  "dso", "error"]
+
+
+class MayaAsciiScanner:
+    """
+    Streaming reader of the standins of a Maya ASCII scene
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        # Full DAG paths by node name
+        self.__paths_by_name = {}
+        # Node type by full path (DAG nodes) or name
+        self.__types = {}
+        self.__dsos = {}
+        self.__filenames = {}
+        # [(include graph, standin, index)]
+        self.__connections = []
+        self.__current_node = None
+
+    @staticmethod
+    def __read_statements(scene_file):
+        """
+        Read the statements of the commands of interest, a statement starts at a line indented by one tab
+        at most and continues on the lines indented by two tabs
+        :param scene_file
+        :return: generator of (command, statement)
+        """
+        command = None
+        lines = []
+        for line in scene_file:
+            if line.startswith("\t\t"):
+                if command is not None:
+                    lines.append(line)
+                continue
+            if command is not None:
+                yield command, "".join(lines)
+                command = None
+            match = _STATEMENT_START_PATTERN.match(line)
+            if match is not None and match.group(1) in _COMMANDS:
+                command = match.group(1)
+                lines = [line]
+        if command is not None:
+            yield command, "".join(lines)
+
+    @staticmethod
+    def __split(statement):
+        """
+        Split a statement in arguments
+        :param statement
+        :return: arguments
+        """
+        statement = statement.strip()
+        if statement.endswith(";"):
+            statement = statement[:-1]
+        try:
+            return shlex.split(statement, posix=True)
+        except ValueError:
+            return []
+
+    @staticmethod
+    def __get_flag(args, flag):
+        """
+        Getter of the value of a flag of a command
+        :param args
+        :param flag
+        :return: value or None
+        """
+        try:
+            return args[args.index(flag) + 1]
+        except (ValueError, IndexError):
+            return None
+
+    def __resolve_path(self, name):
+        """
+        Resolve the full path of a node given by a partial path
+        :param name
+        :return: full path
+        """
+        if name.startswith("|"):
+            return name
+        candidates = self.__paths_by_name.get(name.split("|")[-1])
+        if not candidates:
+            return name
+        for path in candidates:
+            if path.endswith("|" + name):
+                return path
+        return candidates[0]
+
+    def __on_create_node(self, args):
+        """
+        Handle a createNode statement
+        :param args
+        :return:
+        """
+        if len(args) < 2:
+            self.__current_node = None
+            return
+        node_type = args[1]
+        name = self.__get_flag(args, "-n") or self.__get_flag(args, "-name")
+        if name is None:
+            self.__current_node = None
+            return
+        parent = self.__get_flag(args, "-p") or self.__get_flag(args, "-parent")
+        if parent is not None:
+            node = self.__resolve_path(parent) + "|" + name
+        elif node_type == _INCLUDE_GRAPH_TYPE:
+            # DG node
+            node = name
+        else:
+            node = "|" + name
+        self.__paths_by_name.setdefault(name, []).append(node)
+        self.__types[node] = node_type
+        self.__current_node = node
+
+    def __on_set_attr(self, args):
+        """
+        Handle a setAttr statement on the current node
+        :param args
+        :return:
+        """
+        if self.__current_node is None or len(args) < 3:
+            return
+        node_type = self.__types.get(self.__current_node)
+        if node_type == _STANDIN_TYPE and args[1] == ".dso":
+            self.__dsos[self.__current_node] = args[-1]
+        elif node_type == _INCLUDE_GRAPH_TYPE and args[1] == ".filename":
+            self.__filenames[self.__current_node] = args[-1]
+
+    def __on_connect_attr(self, args):
+        """
+        Handle a connectAttr statement
+        :param args
+        :return:
+        """
+        plugs = [arg for arg in args[1:] if not arg.startswith("-")]
+        if len(plugs) < 2:
+            return
+        source_match = _OUT_PLUG_PATTERN.match(plugs[0])
+        destination_match = _OPERATOR_PLUG_PATTERN.match(plugs[1])
+        if source_match is None or destination_match is None:
+            return
+        self.__connections.append((source_match.group(1), destination_match.group(1),
+                                   int(destination_match.group(2))))
+
+    def scan(self, filepath):
+        """
+        Scan a Maya ASCII scene
+        :param filepath
+        :return: standin records [{"object", "dso", "plugged"}]
+        """
+        with open(filepath, "r", encoding="utf-8", errors="replace") as scene_file:
+            for command, statement in MayaAsciiScanner.__read_statements(scene_file):
+                if command == "createNode":
+                    self.__on_create_node(MayaAsciiScanner.__split(statement))
+                elif command == "setAttr":
+                    self.__on_set_attr(MayaAsciiScanner.__split(statement))
+                elif command == "connectAttr":
+                    self.__on_connect_attr(MayaAsciiScanner.__split(statement))
+                else:
+                    # select changes the node the setAttr apply to
+                    self.__current_node = None
+
+        plugged_by_standin = {}
+        for include_graph, standin, index in self.__connections:
+            standin = self.__resolve_path(standin)
+            filename = self.__filenames.get(include_graph)
+            if self.__types.get(standin) == _STANDIN_TYPE and filename is not None:
+                plugged_by_standin.setdefault(standin, []).append((index, filename))
+        records = []
+        for standin, node_type in self.__types.items():
+            if node_type != _STANDIN_TYPE or standin.split("|")[-1].startswith("frame"):
+                continue
+            plugged = [filename for _, filename in sorted(plugged_by_standin.get(standin, []))]
+            records.append({"object": standin.rsplit("|", 1)[0], "dso": self.__dsos.get(standin), "plugged": plugged})
+        return records
+
+
+def _make_row(scene_filepath, **values):
+    """
+    Make a row of the report
+    :param scene_filepath
+    :param values: values of the other fields
+    :return: row
+    """
+    row = dict.fromkeys(_REPORT_FIELDS)
+    row["scene"] = scene_filepath
+    row.update(values)
+    return row
+
+
+def scan_scene(current_project_dir, scene_filepath):
+    """
+    Report the status of the standins of a scene
+    :param current_project_dir
+    :param scene_filepath
+    :return: report rows
+    """
+    try:
+        records = MayaAsciiScanner().scan(scene_filepath)
+    except OSError as e:
+        return [_make_row(scene_filepath, error="Scene can't be read : %s" % e)]
+    rows = []
+    records_with_dso = []
+    for record in records:
+        if record["dso"]:
+            records_with_dso.append(record)
+        else:
+            rows.append(_make_row(scene_filepath, object=record["object"], error="StandIn without dso"))
+    for record, status in zip(records_with_dso, resolve_records(current_project_dir, records_with_dso)):
+        if status is None:
+            # Not a standin of an asset
+            continue
+        rows.append(_make_row(
+            scene_filepath,
+            object=status["object"],
+            standin_name=status["standin_name"],
+            kind=status["kind"],
+            looks_up_to_date=status["looks_up_to_date"],
+            versions_behind=status["versions_behind"],
+            uv_up_to_date=status["uv_up_to_date"],
+            dso=record["dso"]))
+    return rows
+
+
+def scan_scenes_parallel(current_project_dir, scene_filepaths, processes=None):
+    """
+    Report the status of the standins of scenes in a process pool
+    :param current_project_dir
+    :param scene_filepaths
+    :param processes: number of processes (number of cpus if None)
+    :return: report rows in the order of the scenes
+    """
+    rows = []
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        for scene_rows in executor.map(scan_scene, [current_project_dir] * len(scene_filepaths), scene_filepaths):
+            rows.extend(scene_rows)
+    return rows
+
+
+def list_scenes(paths):
+    """
+    List the Maya ASCII scenes of files and directories
+    :param paths
+    :return: scene filepaths
+    """
+    scene_filepaths = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, filenames in os.walk(path):
+                scene_filepaths.extend(os.path.join(root, filename).replace("\\", "/")
+                                       for filename in sorted(filenames) if filename.endswith(".ma"))
+        else:
+            scene_filepaths.append(path)
+    return scene_filepaths
+
+
+def write_report(rows, output_file, report_format):
+    """
+    Write the report
+    :param rows
+    :param output_file
+    :param report_format: "csv" or "json"
+    :return:
+    """
+    if report_format == "json":
+        json.dump(rows, output_file, indent=2)
+    else:
+        writer = csv.DictWriter(output_file, fieldnames=_REPORT_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main(argv=None):
+    """
+    Command line entry point
+    :param argv
+    :return: exit code (1 if out of date standins or errors have been found)
+    """
+    parser = argparse.ArgumentParser(description="Report the look and UV status of the standins of Maya ASCII scenes")
+    parser.add_argument("scenes", nargs="+", help="Maya ASCII scenes or directories of scenes")
+    parser.add_argument("-p", "--project", default=os.getenv("CURRENT_PROJECT_DIR"),
+                        help="Project directory (CURRENT_PROJECT_DIR by default)")
+    parser.add_argument("-o", "--output", help="Report file, CSV or JSON according to its extension (stdout by default)")
+    parser.add_argument("-f", "--format", choices=["csv", "json"], help="Format of the report")
+    parser.add_argument("-j", "--processes", type=int, default=None, help="Number of processes")
+    parser.add_argument("--out-of-date", action="store_true",
+                        help="Only report the out of date standins and the errors")
+    args = parser.parse_args(argv)
+    if args.project is None:
+        parser.error("Project directory not found, use --project or CURRENT_PROJECT_DIR")
+
+    report_format = args.format
+    if report_format is None:
+        report_format = "json" if args.output is not None and args.output.endswith(".json") else "csv"
+    rows = scan_scenes_parallel(args.project, list_scenes(args.scenes), args.processes)
+    out_of_date = [row for row in rows if row["error"] is not None or not row["looks_up_to_date"] or
+                   not row["uv_up_to_date"]]
+    if args.out_of_date:
+        rows = out_of_date
+    if args.output is None:
+        write_report(rows, sys.stdout, report_format)
+    else:
+        with open(args.output, "w", newline="") as output_file:
+            write_report(rows, output_file, report_format)
+    return 1 if len(out_of_date) > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,282 @@
+from PySide2.QtCore import Qt, QAbstractTableModel, QModelIndex, QEvent, QRect, Signal
+from PySide2.QtGui import QColor
+from PySide2.QtWidgets import QStyledItemDelegate, QStyleOptionButton, QStyle, QApplication
+
+# Role giving whether the UVs of a row can be updated
+UV_OUT_OF_DATE_ROLE = Qt.UserRole + 1
+
+
+class StandinTableModel(QAbstractTableModel):
+    COLUMNS = ["Name", "Standin Name", "Number looks", "Versions behind", "UVs"]
+    VERSIONS_BEHIND_COLUMN = 3
+    UV_COLUMN = 4
+
+    def __init__(self, parent=None):
+        """
+        Constructor
+        :param parent
+        """
+        super(StandinTableModel, self).__init__(parent)
+        self.__standins = []
+        self.__rows = {}
+        # Values computed once per change of a standin instead of at each paint
+        self.__row_data = {}
+        # Column sorted, None to keep the order of the standins given
+        self.__sort_column = None
+        self.__sort_order = Qt.AscendingOrder
+
+    def __compute_row_data(self, standin_obj):
+        """
+        Compute the values displayed for a standin
+        :param standin_obj
+        :return: (number of looks, versions behind, uv up to date) or None if not resolved
+        """
+        if not standin_obj.is_resolved():
+            return None
+        return str(len(standin_obj.get_looks())), standin_obj.get_versions_behind(), standin_obj.is_uv_up_to_date()
+
+    def __get_sort_value(self, standin_obj):
+        """
+        Getter of the value of a standin in the sorted column, the numbers are compared as numbers
+        :param standin_obj
+        :return: value or None if not resolved yet
+        """
+        if self.__sort_column == 0:
+            return standin_obj.get_object_name()
+        if self.__sort_column == 1:
+            return standin_obj.get_standin_name()
+        if standin_obj in self.__row_data:
+            row_data = self.__row_data[standin_obj]
+        else:
+            row_data = self.__compute_row_data(standin_obj)
+        if row_data is None:
+            return None
+        if self.__sort_column == 2:
+            return int(row_data[0])
+        if self.__sort_column == StandinTableModel.VERSIONS_BEHIND_COLUMN:
+            return row_data[1]
+        return row_data[2]
+
+    def __sorted(self, standins):
+        """
+        Sort standins according to the column sorted. The standins not resolved yet are put last
+        :param standins
+        :return: standins sorted
+        """
+        if self.__sort_column is None:
+            return list(standins)
+        values = {standin_obj: self.__get_sort_value(standin_obj) for standin_obj in standins}
+        resolved = [standin_obj for standin_obj in standins if values[standin_obj] is not None]
+        not_resolved = [standin_obj for standin_obj in standins if values[standin_obj] is None]
+        # The object name breaks the ties so that the order doesn't depend on the order given
+        resolved.sort(key=lambda standin_obj: (values[standin_obj], standin_obj.get_object_name()),
+                      reverse=self.__sort_order == Qt.DescendingOrder)
+        not_resolved.sort(key=lambda standin_obj: standin_obj.get_object_name())
+        return resolved + not_resolved
+
+    def __relayout(self, standins):
+        """
+        Move the rows to a new order of the same standins, the selection and the persistent indexes follow their rows
+        :param standins
+        :return:
+        """
+        self.layoutAboutToBeChanged.emit()
+        previous_standins = self.__standins
+        self.__standins = standins
+        self.__update_rows()
+        previous_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(
+            previous_indexes, [self.index(self.__rows[previous_standins[index.row()]], index.column())
+                               for index in previous_indexes])
+        self.layoutChanged.emit()
+
+    def __update_rows(self):
+        """
+        Update the row index of each standin
+        :return:
+        """
+        self.__rows = {standin_obj: row for row, standin_obj in enumerate(self.__standins)}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.__standins)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(StandinTableModel.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return StandinTableModel.COLUMNS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        standin_obj = self.__standins[index.row()]
+        column = index.column()
+        row_data = self.__row_data.get(standin_obj)
+        if role == Qt.UserRole:
+            return standin_obj
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter if column > 0 else None
+        if role == Qt.ForegroundRole:
+            if column >= 2 and row_data is None:
+                return QColor(128, 128, 128)
+            if column == StandinTableModel.VERSIONS_BEHIND_COLUMN and row_data[1] > 0:
+                return QColor(255, 255, 0)
+            return None
+        if role == UV_OUT_OF_DATE_ROLE:
+            return column == StandinTableModel.UV_COLUMN and row_data is not None and not row_data[2]
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return standin_obj.get_object_name()
+            if column == 1:
+                return standin_obj.get_standin_name()
+            if row_data is None:
+                return "Resolving…"
+            if column == 2:
+                return row_data[0]
+            if column == StandinTableModel.VERSIONS_BEHIND_COLUMN:
+                return str(row_data[1])
+            return "Up to date" if row_data[2] else ""
+        return None
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        if column < 0:
+            # Sorting disabled : the next standins set keep their order
+            self.__sort_column = None
+            return
+        self.__sort_column = column
+        self.__sort_order = order
+        standins = self.__sorted(self.__standins)
+        if standins != self.__standins:
+            self.__relayout(standins)
+
+    def get_standin(self, row):
+        """
+        Getter of the standin of a row
+        :param row
+        :return: standin
+        """
+        return self.__standins[row]
+
+    def get_row(self, standin_obj):
+        """
+        Getter of the row of a standin
+        :param standin_obj
+        :return: row or None
+        """
+        return self.__rows.get(standin_obj)
+
+    def set_standins(self, standins):
+        """
+        Set the standins displayed, in the order of the column sorted. Only the rows removed and inserted are signaled
+        :param standins
+        :return:
+        """
+        standins = self.__sorted(standins)
+        new_set = set(standins)
+        # Remove the rows that are not displayed anymore
+        row = len(self.__standins) - 1
+        while row >= 0:
+            if self.__standins[row] in new_set:
+                row -= 1
+                continue
+            last = row
+            while row - 1 >= 0 and self.__standins[row - 1] not in new_set:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row, last)
+            for standin_obj in self.__standins[row:last + 1]:
+                self.__row_data.pop(standin_obj, None)
+            del self.__standins[row:last + 1]
+            self.endRemoveRows()
+            row -= 1
+
+        # The kept rows must be in the same order, otherwise the model is reset
+        kept_set = set(self.__standins)
+        if [standin_obj for standin_obj in standins if standin_obj in kept_set] != self.__standins:
+            self.beginResetModel()
+            self.__standins = list(standins)
+            self.__row_data = {standin_obj: self.__compute_row_data(standin_obj) for standin_obj in standins}
+            self.__update_rows()
+            self.endResetModel()
+            return
+
+        # Insert the new rows
+        for row, standin_obj in enumerate(standins):
+            if row < len(self.__standins) and self.__standins[row] is standin_obj:
+                continue
+            self.beginInsertRows(QModelIndex(), row, row)
+            self.__standins.insert(row, standin_obj)
+            self.__row_data[standin_obj] = self.__compute_row_data(standin_obj)
+            self.endInsertRows()
+        self.__update_rows()
+
+    def refresh_standins(self, standins):
+        """
+        Refresh the rows of some standins
+        :param standins
+        :return:
+        """
+        rows_changed = []
+        for standin_obj in standins:
+            row = self.__rows.get(standin_obj)
+            if row is None:
+                continue
+            row_data = self.__compute_row_data(standin_obj)
+            if self.__row_data.get(standin_obj) == row_data:
+                continue
+            self.__row_data[standin_obj] = row_data
+            rows_changed.append(row)
+        if len(rows_changed) > 0 and self.__sort_column is not None and self.__sort_column >= 2:
+            # The values sorted have changed : the rows are moved if needed
+            standins = self.__sorted(self.__standins)
+            if standins != self.__standins:
+                self.__relayout(standins)
+                return
+        # One notification per run of consecutive rows changed
+        rows_changed.sort()
+        start = 0
+        for i in range(1, len(rows_changed) + 1):
+            if i == len(rows_changed) or rows_changed[i] != rows_changed[i - 1] + 1:
+                self.dataChanged.emit(self.index(rows_changed[start], 2),
+                                      self.index(rows_changed[i - 1], StandinTableModel.UV_COLUMN))
+                start = i
+
+
+class UpdateButtonDelegate(QStyledItemDelegate):
+    # Emitted with the index of the row when the update button is clicked
+    update_clicked = Signal(QModelIndex)
+
+    __MARGIN = 3
+
+    def __button_rect(self, option):
+        """
+        Getter of the rect of the button within the cell
+        :param option
+        :return: rect
+        """
+        margin = UpdateButtonDelegate.__MARGIN
+        return option.rect.adjusted(margin, margin, -margin, -margin)
+
+    def paint(self, painter, option, index):
+        if not index.data(UV_OUT_OF_DATE_ROLE):
+            super(UpdateButtonDelegate, self).paint(painter, option, index)
+            return
+        button_option = QStyleOptionButton()
+        button_option.rect = QRect(self.__button_rect(option))
+        button_option.text = "Update"
+        button_option.state = QStyle.State_Enabled | QStyle.State_Raised
+        style = option.widget.style() if option.widget is not None else QApplication.style()
+        style.drawControl(QStyle.CE_PushButton, button_option, painter, option.widget)
+
+    def editorEvent(self, event, model, option, index):
+        if index.data(UV_OUT_OF_DATE_ROLE) and event.type() == QEvent.MouseButtonRelease and \
+                self.__button_rect(option).contains(event.pos()):
+            self.update_clicked.emit(index)
+            return True
+        return super(UpdateButtonDelegate, self).editorEvent(event, model, option, index)
@@ -0,0 +1,132 @@
+import glob
+import os
+import re
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from .AssInspector import ass_inspector
+from .Instrumentation import instrumentation
+
+# Tokens expanded by Arnold in the texture paths (<udim>, <tile>, <attr:name>...)
+_TOKEN_PATTERN = re.compile(r"<[^<>]+>")
+
+# Files referenced by a look that are missing or empty
+LookValidation = namedtuple("LookValidation", ["path", "references", "missing", "empty"])
+
+
+class TextureValidator:
+    """
+    Check that the textures and files referenced by look .ass files exist and are not empty before the looks are
+    plugged. The looks are inspected and the files are stat concurrently in a bounded pool, the validations are kept
+    by look path and modification time
+    """
+
+    def __init__(self, max_workers=16):
+        """
+        Constructor
+        :param max_workers: maximum number of looks inspected and files stat at once
+        """
+        self.__max_workers = max_workers
+        self.__validations = {}
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def __resolve_reference(look_path, reference):
+        """
+        Resolve the path of a file referenced by a look
+        :param look_path
+        :param reference: path as written in the look
+        :return: path
+        """
+        path = os.path.expandvars(reference).replace("\\", "/")
+        if not os.path.isabs(path):
+            path = os.path.join(os.path.dirname(look_path), path).replace("\\", "/")
+        return path
+
+    @staticmethod
+    def __get_size(path):
+        """
+        Getter of the size of a file, the smallest of the files matching the tokens of the path
+        :param path
+        :return: size or None if the file doesn't exist
+        """
+        instrumentation.count("fs.stat")
+        if _TOKEN_PATTERN.search(path) is None:
+            try:
+                return os.stat(path).st_size
+            except OSError:
+                return None
+        sizes = []
+        for tile_path in glob.glob(_TOKEN_PATTERN.sub("*", glob.escape(path))):
+            try:
+                sizes.append(os.stat(tile_path).st_size)
+            except OSError:
+                continue
+        return min(sizes) if len(sizes) > 0 else None
+
+    @staticmethod
+    def __get_signature(look_path):
+        """
+        Getter of what identifies a version of a look file
+        :param look_path
+        :return: (mtime, size) or None if the look doesn't exist
+        """
+        try:
+            stat = os.stat(look_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @instrumentation.counted("texture.validate")
+    def validate(self, look_paths):
+        """
+        Validate the files referenced by looks, the looks not validated yet are inspected and all their files are stat
+        in one pool
+        :param look_paths
+        :return: {look path: LookValidation or None if the look can't be read}
+        """
+        validations = {}
+        signatures = {}
+        for look_path in look_paths:
+            signature = TextureValidator.__get_signature(look_path)
+            if signature is None:
+                validations[look_path] = None
+                continue
+            with self.__lock:
+                entry = self.__validations.get(look_path)
+            if entry is not None and entry[0] == signature:
+                instrumentation.count("texture.hit")
+                validations[look_path] = entry[1]
+                continue
+            signatures[look_path] = signature
+        if len(signatures) == 0:
+            return validations
+
+        references_by_look = {}
+        with ThreadPoolExecutor(max_workers=self.__max_workers, thread_name_prefix="look_loader_validate") as executor:
+            with instrumentation.span("TextureValidator.inspect"):
+                summaries = dict(zip(signatures, executor.map(ass_inspector.inspect, signatures)))
+            for look_path, summary in summaries.items():
+                if summary is None:
+                    validations[look_path] = None
+                    continue
+                references_by_look[look_path] = {
+                    reference: TextureValidator.__resolve_reference(look_path, reference)
+                    for reference in summary.get_file_references()}
+            paths = list({path for references in references_by_look.values() for path in references.values()})
+            with instrumentation.span("TextureValidator.stat"):
+                sizes = dict(zip(paths, executor.map(TextureValidator.__get_size, paths)))
+
+        for look_path, references in references_by_look.items():
+            missing = [reference for reference, path in references.items() if sizes[path] is None]
+            empty = [reference for reference, path in references.items() if sizes[path] == 0]
+            validation = LookValidation(look_path, tuple(references), tuple(missing), tuple(empty))
+            with self.__lock:
+                self.__validations[look_path] = (signatures[look_path], validation)
+            validations[look_path] = validation
+        return validations
+
+
+# Validator shared by the tool
+texture_validator = TextureValidator()
@@ -0,0 +1,52 @@
+from collections import Counter
+
+from ..SceneAdapter import MemorySceneAdapter
+
+
+class CountingSceneAdapter(MemorySceneAdapter):
+    """
+    In-memory stand-in for the Maya calls of the looks resolution that counts every scene query (DG call)
+    """
+
+    __COUNTED = ["list_standins", "list_selected_standins", "get_object_name", "get_dso", "set_dso",
+                 "get_plugged_include_graphs", "get_operators", "create_include_graph", "set_include_graph_filename",
+                 "rename_include_graph", "connect_operator", "disconnect_operator", "clear_selection"]
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        super(CountingSceneAdapter, self).__init__()
+        self.__counts = Counter()
+        self.__counting = False
+        for method_name in CountingSceneAdapter.__COUNTED:
+            setattr(self, method_name, self.__counted(method_name, getattr(self, method_name)))
+
+    def __counted(self, method_name, method):
+        """
+        Wrap a method to count its calls
+        :param method_name
+        :param method
+        :return: wrapped method
+        """
+        def wrapper(*args, **kwargs):
+            if self.__counting:
+                self.__counts[method_name] += 1
+            return method(*args, **kwargs)
+        return wrapper
+
+    def start_counting(self):
+        """
+        Reset the counters and start counting
+        :return:
+        """
+        self.__counts.clear()
+        self.__counting = True
+
+    def stop_counting(self):
+        """
+        Stop counting
+        :return: calls by method
+        """
+        self.__counting = False
+        return dict(self.__counts)
@@ -0,0 +1,247 @@
+"""
+Benchmark of the looks resolution on a synthetic project and an in-memory scene
+
+Usage : python -m look_loader.benchmark.LookBenchmark [--sizes 100 1000 5000] [--save FILE] [--compare FILE]
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter
+
+from ..LookFactory import LookFactory
+from .CountingSceneAdapter import CountingSceneAdapter
+from .ProjectGenerator import ProjectGenerator
+
+
+class SyscallCounter:
+    """
+    Context manager counting the filesystem calls done through the os module
+    """
+
+    __PATCHED = [(os, "scandir"), (os, "listdir"), (os, "stat"), (os.path, "isfile"), (os.path, "isdir"),
+                 (os.path, "exists")]
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.__counts = Counter()
+        self.__originals = []
+
+    def __wrap(self, name, function):
+        """
+        Wrap a function to count its calls
+        :param name
+        :param function
+        :return: wrapped function
+        """
+        def wrapper(*args, **kwargs):
+            self.__counts[name] += 1
+            return function(*args, **kwargs)
+        return wrapper
+
+    def __enter__(self):
+        for module, name in SyscallCounter.__PATCHED:
+            original = getattr(module, name)
+            self.__originals.append((module, name, original))
+            setattr(module, name, self.__wrap(name, original))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        for module, name, original in self.__originals:
+            setattr(module, name, original)
+        self.__originals.clear()
+        return False
+
+    def get_counts(self):
+        """
+        Getter of the calls by function
+        :return: counts
+        """
+        return dict(self.__counts)
+
+
+class LookBenchmark:
+    def __init__(self, project_generator):
+        """
+        Constructor
+        :param project_generator: ProjectGenerator of the project already generated
+        """
+        self.__project_generator = project_generator
+
+    def build_scene(self, nb_standins):
+        """
+        Build an in-memory scene of standins instancing the assets of the project. Half of them have
+        an anterior version of their default look plugged
+        :param nb_standins
+        :return: scene adapter
+        """
+        scene_adapter = CountingSceneAdapter()
+        dsos = self.__project_generator.get_dsos()
+        for i in range(nb_standins):
+            asset, dso, fur = dsos[i % len(dsos)]
+            plugged = [self.__project_generator.get_look_path(asset, 1, fur=fur)] if i % 2 == 0 else []
+            scene_adapter.add_standin("standin%06d" % i, dso, plugged)
+        return scene_adapter
+
+    def __new_factory(self, scene_adapter):
+        """
+        Create a LookFactory on the project
+        :param scene_adapter
+        :return: look factory
+        """
+        return LookFactory(self.__project_generator.get_root_dir(), scene_adapter=scene_adapter, use_index=False)
+
+    @staticmethod
+    def __generate_all(look_factory, scene_adapter):
+        """
+        Generate the LookStandins of all the standins of the scene
+        :param look_factory
+        :param scene_adapter
+        :return: look objs
+        """
+        look_objs = []
+        for standin in scene_adapter.list_standins():
+            look_obj = look_factory.generate(standin)
+            if look_obj is not None:
+                look_objs.append(look_obj)
+        return look_objs
+
+    def __measure(self, scene_adapter, function):
+        """
+        Measure a function
+        :param scene_adapter
+        :param function
+        :return: measures
+        """
+        with SyscallCounter() as syscall_counter:
+            scene_adapter.start_counting()
+            start = time.perf_counter()
+            function()
+            wall_time = time.perf_counter() - start
+            dg_counts = scene_adapter.stop_counting()
+        syscall_counts = syscall_counter.get_counts()
+        return {
+            "wall_time": wall_time,
+            "syscalls": sum(syscall_counts.values()),
+            "dg_calls": sum(dg_counts.values()),
+            "syscall_detail": syscall_counts,
+            "dg_call_detail": dg_counts,
+        }
+
+    def run(self, nb_standins):
+        """
+        Run all the scenarios on a scene
+        :param nb_standins
+        :return: measures by scenario
+        """
+        results = {}
+
+        # LookFactory.generate on a fresh factory (cold directory cache)
+        scene_adapter = self.build_scene(nb_standins)
+        look_factory = self.__new_factory(scene_adapter)
+        results["generate"] = self.__measure(
+            scene_adapter, lambda: LookBenchmark.__generate_all(look_factory, scene_adapter))
+
+        # Refresh of the standins of the whole scene as done by the LookLoader (warm directory cache)
+        def retrieve_standins():
+            look_factory.refresh()
+            LookBenchmark.__generate_all(look_factory, scene_adapter)
+        results["retrieve_standins"] = self.__measure(scene_adapter, retrieve_standins)
+
+        # add_looks of a sublook on every standin
+        look_objs = LookBenchmark.__generate_all(look_factory, scene_adapter)
+
+        def add_looks():
+            for look_obj in look_objs:
+                sublooks = [look_data[0] for look_name, look_data in look_obj.get_looks().items()
+                            if look_name not in ["default", "override"]]
+                look_obj.add_looks(sublooks[:1], False)
+        results["add_looks"] = self.__measure(scene_adapter, add_looks)
+
+        # update_existent_looks on a new scene
+        scene_adapter = self.build_scene(nb_standins)
+        look_factory = self.__new_factory(scene_adapter)
+        look_objs = LookBenchmark.__generate_all(look_factory, scene_adapter)
+
+        def update_existent_looks():
+            for look_obj in look_objs:
+                look_obj.update_existent_looks()
+        results["update_existent_looks"] = self.__measure(scene_adapter, update_existent_looks)
+        return results
+
+
+def compare(results, baseline, tolerance):
+    """
+    Compare results with a baseline
+    :param results
+    :param baseline
+    :param tolerance: relative increase allowed
+    :return: regressions found
+    """
+    regressions = []
+    for size, scenarios in results.items():
+        for scenario, measures in scenarios.items():
+            base_measures = baseline.get(size, {}).get(scenario)
+            if base_measures is None:
+                continue
+            for key in ["wall_time", "syscalls", "dg_calls"]:
+                base_value = base_measures[key]
+                value = measures[key]
+                if value > base_value * (1 + tolerance) and value - base_value > 1e-3:
+                    regressions.append("%s standins - %s - %s : %s -> %s" % (size, scenario, key, base_value, value))
+    return regressions
+
+
+def main(argv=None):
+    """
+    Command line entry point
+    :param argv
+    :return: exit code
+    """
+    parser = argparse.ArgumentParser(description="Benchmark of the looks resolution")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000], help="Numbers of standins")
+    parser.add_argument("--assets", type=int, default=30)
+    parser.add_argument("--versions", type=int, default=10)
+    parser.add_argument("--sublooks", type=int, default=5)
+    parser.add_argument("--mod-versions", type=int, default=5)
+    parser.add_argument("--project", help="Directory of the generated project (temporary if not specified)")
+    parser.add_argument("--save", help="Save the results as a baseline JSON file")
+    parser.add_argument("--compare", help="Compare the results with a baseline JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Relative increase allowed against the baseline")
+    args = parser.parse_args(argv)
+
+    root_dir = args.project if args.project is not None else tempfile.mkdtemp(prefix="look_loader_bench_")
+    try:
+        project_generator = ProjectGenerator(root_dir, args.assets, args.versions, args.sublooks, args.mod_versions)
+        project_generator.generate()
+        benchmark = LookBenchmark(project_generator)
+        results = {}
+        for size in args.sizes:
+            results[str(size)] = benchmark.run(size)
+            for scenario, measures in results[str(size)].items():
+                print("%6d standins | %-22s | %8.3f s | %7d syscalls | %7d DG calls" %
+                      (size, scenario, measures["wall_time"], measures["syscalls"], measures["dg_calls"]))
+    finally:
+        if args.project is None:
+            shutil.rmtree(root_dir, ignore_errors=True)
+
+    if args.save is not None:
+        with open(args.save, "w") as baseline_file:
+            json.dump(results, baseline_file, indent=2)
+    if args.compare is not None:
+        with open(args.compare, "r") as baseline_file:
+            regressions = compare(results, json.load(baseline_file), args.tolerance)
+        for regression in regressions:
+            print("REGRESSION " + regression)
+        if len(regressions) > 0:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+import os
+
+
+class ProjectGenerator:
+    def __init__(self, root_dir, nb_assets=30, nb_versions=10, nb_sublooks=5, nb_mod_versions=5, fur_ratio=0.2):
+        """
+        Constructor. Generator of a synthetic CURRENT_PROJECT_DIR tree
+        :param root_dir: project directory created
+        :param nb_assets
+        :param nb_versions: number of published versions of each look
+        :param nb_sublooks: number of sublooks of each asset
+        :param nb_mod_versions: number of abc/*_mod.vNNN.abc of each asset
+        :param fur_ratio: ratio of the assets that have a fur
+        """
+        self.__root_dir = root_dir
+        self.__nb_assets = nb_assets
+        self.__nb_versions = nb_versions
+        self.__nb_sublooks = nb_sublooks
+        self.__nb_mod_versions = nb_mod_versions
+        self.__nb_fur_assets = int(nb_assets * fur_ratio)
+
+    @staticmethod
+    def __touch(path):
+        """
+        Create an empty file
+        :param path
+        :return:
+        """
+        open(path, "w").close()
+
+    def get_root_dir(self):
+        """
+        Getter of the project directory
+        :return: root dir
+        """
+        return self.__root_dir
+
+    def get_asset_names(self):
+        """
+        Getter of the names of the generated assets
+        :return: asset names
+        """
+        return ["asset%04d" % i for i in range(self.__nb_assets)]
+
+    def get_dsos(self):
+        """
+        Getter of the dso of a standin for each asset and fur
+        :return: [(asset name, dso, is fur)]
+        """
+        dsos = []
+        for i, asset in enumerate(self.get_asset_names()):
+            asset_dir = os.path.join(self.__root_dir, "assets", asset).replace("\\", "/")
+            # Standins loading an old mod so that the UVs can be updated
+            dsos.append((asset, asset_dir + "/abc/" + asset + "_mod.v001.abc", False))
+            if i < self.__nb_fur_assets:
+                dsos.append((asset, asset_dir + "/abc_fur/" + asset + "_01_fur.abc", True))
+        return dsos
+
+    def get_look_path(self, asset, version, sublook=None, fur=False):
+        """
+        Getter of the path of a published look
+        :param asset
+        :param version
+        :param sublook
+        :param fur
+        :return: look path
+        """
+        suffix = "_fur" if fur else "_operator"
+        publish_dir = os.path.join(self.__root_dir, "assets", asset, "publish").replace("\\", "/")
+        if sublook is None:
+            return "%s/%s%s.v%03d.ass" % (publish_dir, asset, suffix, version)
+        folder = "look_fur" if fur else "look"
+        return "%s/%s/%s/%s_%s%s.v%03d.ass" % (publish_dir, folder, sublook, asset, sublook, suffix, version)
+
+    def generate(self):
+        """
+        Generate the project tree
+        :return: number of files created
+        """
+        nb_files = 0
+        for i, asset in enumerate(self.get_asset_names()):
+            asset_dir = os.path.join(self.__root_dir, "assets", asset)
+            kinds = [False, True] if i < self.__nb_fur_assets else [False]
+            for fur in kinds:
+                folder = "look_fur" if fur else "look"
+                for version in range(1, self.__nb_versions + 1):
+                    look_path = self.get_look_path(asset, version, fur=fur)
+                    os.makedirs(os.path.dirname(look_path), exist_ok=True)
+                    ProjectGenerator.__touch(look_path)
+                    nb_files += 1
+                    for s in range(self.__nb_sublooks):
+                        sublook_path = self.get_look_path(asset, version, "sub%02d" % s, fur)
+                        os.makedirs(os.path.dirname(sublook_path), exist_ok=True)
+                        ProjectGenerator.__touch(sublook_path)
+                        nb_files += 1
+                os.makedirs(os.path.join(asset_dir, "publish", folder), exist_ok=True)
+            abc_dir = os.path.join(asset_dir, "abc")
+            os.makedirs(abc_dir, exist_ok=True)
+            for version in range(1, self.__nb_mod_versions + 1):
+                ProjectGenerator.__touch(os.path.join(abc_dir, "%s_mod.v%03d.abc" % (asset, version)))
+                nb_files += 1
+            if i < self.__nb_fur_assets:
+                fur_dir = os.path.join(asset_dir, "abc_fur")
+                os.makedirs(fur_dir, exist_ok=True)
+                ProjectGenerator.__touch(os.path.join(fur_dir, asset + "_01_fur.abc"))
+                nb_files += 1
+        return nb_files
@@ -1,12 +1,4 @@
-import importlib
-from common import utils
+from look_loader import Launcher
 
-utils.unload_packages(silent=True, package="look_loader")
-importlib.import_module("look_loader")
-from look_loader.LookLoader import LookLoader
-try:
-    look_loader.close()
-except:
-    pass
-look_loader = LookLoader()
-look_loader.show()
+# Launcher.show(reload=True) reloads the modules of the tool
+Launcher.show()
@@ -0,0 +1,46 @@
+import importlib.util
+import os
+import sys
+import types
+
+_PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _stub_common():
+    """
+    Stub the common package of the Illogic tools when it is not installed : only the helpers used outside of the UI
+    :return:
+    """
+    try:
+        import common.utils
+        return
+    except ImportError:
+        pass
+    common = types.ModuleType("common")
+    common.__path__ = []
+    utils = types.ModuleType("common.utils")
+
+    def print_warning(msg, char_filler="-"):
+        sys.stderr.write(msg + "\n")
+    utils.print_warning = print_warning
+    common.utils = utils
+    sys.modules["common"] = common
+    sys.modules["common.utils"] = utils
+
+
+def _register_package():
+    """
+    Make the checkout importable as look_loader whatever the name of its folder
+    :return:
+    """
+    if "look_loader" in sys.modules:
+        return
+    spec = importlib.util.spec_from_file_location("look_loader", os.path.join(_PACKAGE_DIR, "__init__.py"),
+                                                  submodule_search_locations=[_PACKAGE_DIR])
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["look_loader"] = module
+    spec.loader.exec_module(module)
+
+
+_stub_common()
+_register_package()
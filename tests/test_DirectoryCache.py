@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+
+from look_loader.DirectoryCache import DirectoryCache
+
+
+class DirectoryCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.__tmp_dir = tempfile.TemporaryDirectory()
+        self.__dirs = []
+        for i in range(5):
+            directory = os.path.join(self.__tmp_dir.name, "dir%d" % i)
+            os.mkdir(directory)
+            open(os.path.join(directory, "file%d.ass" % i), "w").close()
+            self.__dirs.append(directory)
+
+    def tearDown(self):
+        self.__tmp_dir.cleanup()
+
+    def test_listdir_evicts_the_least_recently_used(self):
+        dir_cache = DirectoryCache(max_size=2)
+        for directory in self.__dirs:
+            self.assertEqual([entry.name for entry in dir_cache.listdir(directory)],
+                             ["file%d.ass" % self.__dirs.index(directory)])
+        self.assertEqual(len(dir_cache), 2)
+
+        # The evicted directory is listed again
+        open(os.path.join(self.__dirs[0], "new.ass"), "w").close()
+        self.assertEqual([entry.name for entry in dir_cache.listdir(self.__dirs[0])], ["file0.ass", "new.ass"])
+        self.assertEqual(len(dir_cache), 2)
+
+    def test_pop_changed_keeps_the_evicted_listings(self):
+        dir_cache = DirectoryCache(max_size=2)
+        for directory in self.__dirs:
+            dir_cache.listdir(directory)
+        changed = dir_cache.pop_changed()
+        self.assertEqual(set(changed), {directory.replace("\\", "/") for directory in self.__dirs})
+        mtime, entries = changed[self.__dirs[0].replace("\\", "/")]
+        self.assertEqual(mtime, os.stat(self.__dirs[0]).st_mtime_ns)
+        self.assertEqual(entries, [("file0.ass", True, False)])
+        self.assertEqual(dir_cache.pop_changed(), {})
+
+    def test_loaded_listing_is_used_while_the_directory_is_unchanged(self):
+        dir_cache = DirectoryCache(max_size=2)
+        directory = self.__dirs[0]
+        dir_cache.load({directory: (os.stat(directory).st_mtime_ns, [("known.ass", True, False)])})
+        self.assertEqual([entry.name for entry in dir_cache.listdir(directory)], ["known.ass"])
+        self.assertEqual(dir_cache.pop_changed(), {})
+
+        # Still known once evicted by the other directories
+        for other_directory in self.__dirs[1:]:
+            dir_cache.listdir(other_directory)
+        self.assertEqual([entry.name for entry in dir_cache.listdir(directory)], ["known.ass"])
+
+    def test_loaded_listing_is_listed_again_once_modified(self):
+        dir_cache = DirectoryCache()
+        directory = self.__dirs[0]
+        dir_cache.load({directory: (os.stat(directory).st_mtime_ns - 1, [("known.ass", True, False)])})
+        self.assertEqual([entry.name for entry in dir_cache.listdir(directory)], ["file0.ass"])
+        self.assertIn(directory.replace("\\", "/"), dir_cache.pop_changed())
+
+    def test_refresh_checks_the_mtime_again(self):
+        dir_cache = DirectoryCache()
+        directory = self.__dirs[0]
+        dir_cache.listdir(directory)
+        open(os.path.join(directory, "new.ass"), "w").close()
+        os.utime(directory, ns=(0, os.stat(directory).st_mtime_ns + 1000000000))
+        # Listed at most once per refresh
+        self.assertEqual([entry.name for entry in dir_cache.listdir(directory)], ["file0.ass"])
+        dir_cache.refresh()
+        self.assertEqual([entry.name for entry in dir_cache.listdir(directory)], ["file0.ass", "new.ass"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import os
+import tempfile
+import unittest
+
+from look_loader.LookFactory import LookFactory
+from look_loader.LookStandin import LookPresentState
+from look_loader.SceneAdapter import MemorySceneAdapter
+
+
+class LookStandinTest(unittest.TestCase):
+
+    def setUp(self):
+        self.__tmp_dir = tempfile.TemporaryDirectory()
+        self.__project_dir = self.__tmp_dir.name.replace("\\", "/")
+        # Versions 2 and 10 so that the latest is only found with an integer sort
+        self.__touch("publish/treeA_operator.v002.ass")
+        self.__touch("publish/treeA_operator.v010.ass")
+        self.__touch("publish/treeA_operator.ass")
+        self.__touch("publish/look/red/treeA_red_operator.v003.ass")
+        self.__touch("publish/look/red/treeA_red_operator.v012.ass")
+        self.__touch("abc/treeA_mod.v001.abc")
+        self.__touch("abc/treeA_mod.v002.abc")
+        self.__scene_adapter = MemorySceneAdapter()
+
+    def tearDown(self):
+        self.__tmp_dir.cleanup()
+
+    def __get_path(self, relative_path):
+        """
+        Getter of a path in the asset
+        :param relative_path
+        :return: path
+        """
+        return self.__project_dir + "/assets/treeA/" + relative_path
+
+    def __touch(self, relative_path):
+        """
+        Publish an empty file in the asset
+        :param relative_path
+        :return:
+        """
+        path = self.__get_path(relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        open(path, "w").close()
+
+    def __generate(self, plugged_paths=()):
+        """
+        Generate the LookStandin of a new standin of the asset
+        :param plugged_paths: looks plugged on the standin
+        :return: (standin, LookStandin)
+        """
+        standin = self.__scene_adapter.add_standin("tree", self.__get_path("abc/treeA_mod.v001.abc"),
+                                                   [self.__get_path(path) for path in plugged_paths])
+        look_factory = LookFactory(self.__project_dir, scene_adapter=self.__scene_adapter, use_index=False)
+        return standin, look_factory.generate(standin)
+
+    def __get_plugged(self, standin):
+        """
+        Getter of the looks plugged on a standin
+        :param standin
+        :return: sorted plugged paths
+        """
+        return sorted(self.__scene_adapter.get_plugged_include_graphs([standin])[standin])
+
+    def test_latest_versions_are_picked(self):
+        _, look_obj = self.__generate()
+        looks = look_obj.get_looks()
+        self.assertEqual(list(looks), ["default", "override", "red"])
+        self.assertEqual(looks["default"][0], self.__get_path("publish/treeA_operator.v010.ass"))
+        self.assertEqual(looks["override"][0], self.__get_path("publish/treeA_operator.ass"))
+        self.assertEqual(looks["red"][0], self.__get_path("publish/look/red/treeA_red_operator.v012.ass"))
+        self.assertFalse(look_obj.is_uv_up_to_date())
+
+    def test_plugged_looks_are_matched_by_family(self):
+        _, look_obj = self.__generate(["publish/treeA_operator.v002.ass",
+                                       "publish/look/red/treeA_red_operator.v012.ass",
+                                       "publish/look/redish/treeA_redish_operator.v001.ass"])
+        looks = look_obj.get_looks()
+        self.assertEqual(looks["default"][1], LookPresentState.AnteriorVersionPlugged)
+        self.assertEqual(looks["default"][3], 8)
+        self.assertEqual(looks["red"][1], LookPresentState.AlreadyPlugged)
+        # The override look is not a version of the default one
+        self.assertEqual(looks["override"][1], LookPresentState.NotPlugged)
+        self.assertEqual(look_obj.is_looks_up_to_date(with_versions_behind=True), (False, 8))
+
+    def test_update_existent_looks(self):
+        standin, look_obj = self.__generate(["publish/treeA_operator.v002.ass",
+                                             "publish/look/red/treeA_red_operator.v003.ass"])
+        look_obj.update_existent_looks()
+        self.assertEqual(self.__get_plugged(standin),
+                         [self.__get_path("publish/look/red/treeA_red_operator.v012.ass"),
+                          self.__get_path("publish/treeA_operator.ass"),
+                          self.__get_path("publish/treeA_operator.v010.ass")])
+        look_obj.refresh_plugged_looks()
+        self.assertTrue(look_obj.is_looks_up_to_date())
+        self.assertEqual(look_obj.get_versions_behind(), 0)
+
+    def test_add_looks_keeps_the_other_looks(self):
+        standin, look_obj = self.__generate(["publish/treeA_operator.v010.ass"])
+        red_path = self.__get_path("publish/look/red/treeA_red_operator.v012.ass")
+        look_obj.add_looks([red_path], False)
+        self.assertEqual(self.__get_plugged(standin),
+                         [red_path, self.__get_path("publish/treeA_operator.v010.ass")])
+        self.assertEqual(len(self.__scene_adapter.get_operators(standin)), 2)
+
+    def test_add_looks_replaces_the_other_looks(self):
+        standin, look_obj = self.__generate(["publish/treeA_operator.v010.ass", "publish/treeA_operator.ass"])
+        red_path = self.__get_path("publish/look/red/treeA_red_operator.v012.ass")
+        look_obj.add_looks([red_path], True)
+        self.assertEqual(self.__get_plugged(standin), [red_path])
+        # The include graph of a replaced look is reused instead of creating a new one
+        self.assertEqual(len(self.__scene_adapter.get_operators(standin)), 1)
+
+        look_obj.refresh_plugged_looks()
+        look_obj.add_looks([red_path], True)
+        self.assertEqual(self.__get_plugged(standin), [red_path])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import os
+import tempfile
+import unittest
+
+from look_loader.SceneScanner import MayaAsciiScanner, scan_scene
+
+_FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "standins.ma")
+
+
+class MayaAsciiScannerTest(unittest.TestCase):
+
+    def test_scan_reads_the_standins_written_by_maya(self):
+        records = {record["object"]: record for record in MayaAsciiScanner().scan(_FIXTURE)}
+        self.assertEqual(set(records), {"|set_dressing|tree", "|set_dressing|tree|tree", "|empty"})
+        self.assertEqual(records["|set_dressing|tree"]["dso"], "I:/prod/assets/treeA/abc/treeA_mod.v004.abc")
+        self.assertEqual(records["|set_dressing|tree"]["plugged"],
+                         ["I:/prod/assets/treeA/publish/treeA_operator.v010.ass",
+                          "I:/prod/assets/treeA/publish/look/red/treeA_red_operator.v012.ass"])
+        self.assertEqual(records["|set_dressing|tree|tree"]["dso"], "I:/prod/assets/rockB/abc/rockB_mod.v002.abc")
+        self.assertEqual(records["|set_dressing|tree|tree"]["plugged"],
+                         ["I:/prod/assets/rockB/publish/rockB_operator.v001.ass"])
+        self.assertIsNone(records["|empty"]["dso"])
+        self.assertEqual(records["|empty"]["plugged"], [])
+
+    def test_scan_scene_reports_the_errors(self):
+        with tempfile.TemporaryDirectory() as project_dir:
+            rows = scan_scene(project_dir, _FIXTURE)
+            self.assertEqual([(row["object"], row["error"]) for row in rows], [("|empty", "StandIn without dso")])
+
+            missing_scene = os.path.join(project_dir, "missing.ma")
+            rows = scan_scene(project_dir, missing_scene)
+            self.assertEqual(len(rows), 1)
+            self.assertEqual(rows[0]["scene"], missing_scene)
+            self.assertTrue(rows[0]["error"].startswith("Scene can't be read"))
+
+
+if __name__ == "__main__":
+    unittest.main()